@@ -42,6 +42,10 @@ class Config:
     # Maximum allowed duration for input video in seconds (15 minutes = 900 seconds)
     MAX_VIDEO_DURATION_SECONDS: int = int(os.getenv("MAX_VIDEO_DURATION_SECONDS", "900"))
 
+    # Maximum allowed upload size in bytes (default 2 GiB); oversize uploads
+    # are rejected from the Content-Length header before any bytes are stored
+    MAX_UPLOAD_SIZE_BYTES: int = int(os.getenv("MAX_UPLOAD_SIZE_BYTES", str(2 * 1024 ** 3)))
+
     # Allowed upload formats
     ALLOWED_UPLOAD_FORMATS: tuple = tuple(os.getenv("ALLOWED_UPLOAD_FORMATS", "mp4,mov,webm").split(","))
 
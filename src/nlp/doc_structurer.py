@@ -5,6 +5,7 @@ with metadata, statistics, and proper formatting
 """
 
 import logging
+from collections import Counter
 from typing import Dict, List
 
 logger = logging.getLogger(__name__)
@@ -124,11 +125,17 @@ class DocumentStructurer:
         Returns:
             List of key concept strings
         """
+        # No text scanning happens here: the classifier already labelled
+        # definition segments via its keyword trie, so this is a plain
+        # label filter. Stop as soon as the concept cap is reached rather
+        # than collecting everything and slicing.
         concepts = []
         for seg in segments:
             if seg.get("label") == "definition":
                 concepts.append(seg.get("text", ""))
-        return concepts[:10]  # Limit to top 10
+                if len(concepts) == 10:  # Limit to top 10
+                    break
+        return concepts
     
     def _calculate_stats(self, transcript: Dict, 
                         segments: List[Dict]) -> Dict:
@@ -142,20 +149,24 @@ class DocumentStructurer:
         Returns:
             Statistics dictionary
         """
-        label_counts = {}
+        # One traversal for both figures: Counter does the histogram in C,
+        # and counting separators avoids allocating a split list per
+        # segment (cleaned text is already single-space normalized).
+        # A dense fixed-size histogram is not an option here: LLM
+        # classification can emit labels outside the rule set, so the
+        # key space is open-ended.
+        label_counts = Counter()
+        total_words = 0
         for seg in segments:
-            label = seg.get("label", "unknown")
-            label_counts[label] = label_counts.get(label, 0) + 1
-        
-        total_words = sum(
-            len(seg.get("text", "").split()) 
-            for seg in segments
-        )
-        
+            label_counts[seg.get("label", "unknown")] += 1
+            text = seg.get("text", "")
+            if text:
+                total_words += text.count(" ") + 1
+
         return {
             "total_segments": len(segments),
             "total_words": total_words,
-            "label_distribution": label_counts,
+            "label_distribution": dict(label_counts),
             "avg_segment_length": total_words / len(segments) if segments else 0
         }
     
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""
+Keyword Trie Module
+Generated character trie for single-pass keyword detection, shared by
+the classification rules and any other static keyword set
+"""
+
+import logging
+from typing import Dict, List, Sequence, Tuple
+
+from .nlp_config import NLPConfig
+
+logger = logging.getLogger(__name__)
+
+# Node key holding the labels that end at that node; a real character
+# can never collide with it.
+_LEAF = "\0"
+
+
+def is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def at_word_boundary(text: str, index: int, inner: str) -> bool:
+    """Mirror regex `\\b` semantics: word-ness changes across the edge."""
+    outer = text[index] if 0 <= index < len(text) else ""
+    outer_is_word = bool(outer) and is_word_char(outer)
+    return outer_is_word != is_word_char(inner)
+
+
+def build_trie(keywords_by_label: Dict[str, Sequence[str]]) -> Dict:
+    """Generate a nested-dict trie mapping keywords to their labels.
+
+    Keywords are lowercased on insertion; a keyword shared by several
+    labels (e.g. "this is" under explanation and definition) collects
+    all of them at its leaf.
+    """
+    root: Dict = {}
+    for label, keywords in keywords_by_label.items():
+        for word in keywords:
+            node = root
+            for ch in word.lower():
+                node = node.setdefault(ch, {})
+            node.setdefault(_LEAF, []).append(label)
+    return root
+
+
+def scan(trie: Dict, text: str) -> List[Tuple[int, int, str]]:
+    """Find every whole-word keyword occurrence in one left-to-right walk.
+
+    Args:
+        trie: Trie produced by build_trie.
+        text: Lowercased text to scan.
+
+    Returns:
+        List of (start, end, label) spans, including overlapping matches,
+        equivalent to searching each keyword with a `\\b...\\b` regex.
+    """
+    matches: List[Tuple[int, int, str]] = []
+    n = len(text)
+    for i in range(n):
+        node = trie
+        j = i
+        while j < n:
+            node = node.get(text[j])
+            if node is None:
+                break
+            j += 1
+            labels = node.get(_LEAF)
+            if labels and at_word_boundary(text, i - 1, text[i]) and at_word_boundary(text, j, text[j - 1]):
+                for label in labels:
+                    matches.append((i, j, label))
+    return matches
+
+
+# Built once at import: the classification rules are static, so every
+# classifier shares the same generated trie.
+CLASSIFICATION_TRIE = build_trie(NLPConfig.CLASSIFICATION_RULES)
@@ -4,35 +4,44 @@ Contains default settings, rules, and configuration management
 """
 
 import json
+import sys
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional
 
 
 class NLPConfig:
     """Configuration for NLP processing"""
-    
-    DEFAULT_FILLER_WORDS = [
+
+    # Frozen as interned tuples so the static tables hash in O(1), are
+    # shared rather than copied by consumers, and cannot be mutated at
+    # runtime. Keyword order is preserved because the compiled matchers
+    # depend on it.
+    DEFAULT_FILLER_WORDS = tuple(sys.intern(w) for w in (
         "um", "uh", "like", "you know", "sort of", "kind of",
         "i mean", "basically", "actually", "literally",
         "[music]", "[noise]", "[laughter]", "(laughs)", "(applause)",
         "uh-huh", "mm-hmm"
-    ]
-    
-    CLASSIFICATION_RULES = {
+    ))
+
+    # Fast O(1) membership view of the same words.
+    FILLER_WORD_SET = frozenset(DEFAULT_FILLER_WORDS)
+
+    CLASSIFICATION_RULES = MappingProxyType({
         # greetings and closing phrases are handled specially so they can be
         # filtered out prior to building the final document
-        "greeting": ["hello", "hi", "hey", "good morning", "good afternoon", "good evening", "welcome"],
-        "farewell": ["thanks", "thank you", "goodbye", "bye", "see you", "see ya", "take care", "cheers"],
-        "action": ["click", "open", "select", "go to", "press", "drag", 
-                   "type", "enter", "choose", "navigate", "scroll"],
-        "explanation": ["so", "basically", "this is", "what happens", "because",
-                       "the reason", "essentially"],
-        "question": ["how do", "what is", "why does", "can i", "should i"],
-        "transition": ["next", "now", "then", "after that", "moving on",
-                      "let's", "okay so"],
-        "definition": ["this is", "we call this", "defined as", "means",
-                      "refers to"]
-    }
+        "greeting": ("hello", "hi", "hey", "good morning", "good afternoon", "good evening", "welcome"),
+        "farewell": ("thanks", "thank you", "goodbye", "bye", "see you", "see ya", "take care", "cheers"),
+        "action": ("click", "open", "select", "go to", "press", "drag",
+                   "type", "enter", "choose", "navigate", "scroll"),
+        "explanation": ("so", "basically", "this is", "what happens", "because",
+                        "the reason", "essentially"),
+        "question": ("how do", "what is", "why does", "can i", "should i"),
+        "transition": ("next", "now", "then", "after that", "moving on",
+                       "let's", "okay so"),
+        "definition": ("this is", "we call this", "defined as", "means",
+                       "refers to")
+    })
     
     MIN_CONFIDENCE = -1.0  # Minimum confidence threshold
     MIN_SEGMENT_LENGTH = 3  # Minimum characters for valid segment
@@ -77,9 +86,11 @@ class NLPConfig:
         Returns:
             Default configuration dictionary
         """
+        # Return mutable copies: callers may tweak and save_to_file the
+        # result, and the class-level tables are frozen.
         return {
-            "filler_words": cls.DEFAULT_FILLER_WORDS,
-            "classification_rules": cls.CLASSIFICATION_RULES,
+            "filler_words": list(cls.DEFAULT_FILLER_WORDS),
+            "classification_rules": {label: list(words) for label, words in cls.CLASSIFICATION_RULES.items()},
             "min_confidence": cls.MIN_CONFIDENCE,
             "min_segment_length": cls.MIN_SEGMENT_LENGTH,
             "summary_sentence_limit": cls.SUMMARY_SENTENCE_LIMIT
@@ -9,14 +9,149 @@ import logging
 from typing import Dict, Optional, Protocol
 from pathlib import Path
 
-from .text_cleaner import TextCleaner
-from .segment_classifier import SegmentClassifier
+import jinja2
+
+try:
+    # Optional: serializes the document in C and writes bytes directly,
+    # several times faster than json.dump on large timelines.
+    import orjson
+except Exception:  # pragma: no cover - orjson is optional
+    orjson = None
+
+from .nlp_config import NLPConfig
+from .text_cleaner import TextCleaner, get_default_cleaner
+from .segment_classifier import SegmentClassifier, get_default_classifier
 from .summarizer import Summarizer
 from .step_extractor import StepExtractor
 from .doc_structurer import DocumentStructurer
 
 logger = logging.getLogger(__name__)
 
+# Labels dropped from the document body: greetings/farewells plus content
+# the classifier marked as unusable.
+EXCLUDE_LABELS = frozenset({"greeting", "farewell", "noise", "irrelevant"})
+
+# Compiled once at import: Jinja renders the whole Markdown body in one
+# pass over a precompiled template instead of appending ~10 lines per
+# timeline entry to a Python list.
+_MARKDOWN_TEMPLATE = jinja2.Environment(
+    loader=jinja2.BaseLoader(),
+    autoescape=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+).from_string("""\
+# {{ doc.title }}
+
+## Summary
+{{ doc.summary }}
+
+{% if doc.steps %}
+## Steps
+
+{% for step in doc.steps %}
+{{ loop.index }}. {{ step }}
+{% endfor %}
+
+{% endif %}
+{% if doc.key_concepts %}
+## Key Concepts
+
+{% for concept in doc.key_concepts %}
+- {{ concept }}
+{% endfor %}
+
+{% endif %}
+## Timeline
+
+{% for item in doc.timeline %}
+**{{ item.start_formatted }} - {{ item.end_formatted }}** [{{ item.label }}]: {{ item.text }}
+{% endfor %}
+
+## Metadata
+
+- **Video ID**: {{ doc.video_id }}
+- **Language**: {{ doc.metadata.get('language', 'unknown') }}
+- **Model**: {{ doc.metadata.get('model', 'unknown') }}
+- **Duration**: {{ doc.metadata.get('duration', 'unknown') }}s
+- **Processed Segments**: {{ doc.metadata.get('processed_segments', 0) }}
+
+{% if doc.statistics %}
+## Statistics
+
+- **Total Segments**: {{ doc.statistics.get('total_segments', 0) }}
+- **Total Words**: {{ doc.statistics.get('total_words', 0) }}
+- **Average Segment Length**: {{ "%.1f"|format(doc.statistics.get('avg_segment_length', 0)) }} words
+
+### Label Distribution
+
+{% for label, count in doc.statistics.get('label_distribution', {}).items() %}
+- **{{ label }}**: {{ count }}
+{% endfor %}
+{% endif %}""")
+
+
+def _fused_rule_pass(segments, cleaner, classifier):
+    """Clean, classify and collect action steps in one traversal.
+
+    The staged pipeline walks the segment list three times (clean,
+    classify, step-extract), allocating a fresh list of dicts at each
+    stage. For the rule-based path the stages are independent per
+    segment, so one pass touches every string and dict exactly once.
+
+    Segments deliberately stay list-of-dicts rather than a parallel-array
+    layout: every public module API (clean_segments, classify_segments,
+    build_document) and the export boundary speak dicts, and the dominant
+    per-segment cost is string work, not field lookups.
+
+    Returns:
+        (cleaned, filtered, steps) matching the staged pipeline's
+        clean_segments / exclude-filtered classify_segments /
+        pre-merge step texts.
+    """
+    cleaned = []
+    filtered = []
+    steps = []
+
+    clean_text = cleaner.clean_text
+    parse_timestamp = cleaner._parse_timestamp
+    classify = classifier.classify
+    min_length = NLPConfig.MIN_SEGMENT_LENGTH
+
+    for i, seg in enumerate(segments):
+        try:
+            new_seg = dict(seg)
+
+            original_text = seg.get("text", "")
+            text = clean_text(original_text)
+            new_seg["text"] = text
+            new_seg["original_text"] = original_text
+            new_seg["start_seconds"] = parse_timestamp(seg.get("start", "0:00:00"))
+            new_seg["end_seconds"] = parse_timestamp(seg.get("end", "0:00:00"))
+            new_seg["segment_index"] = i
+
+            if len(text.rstrip(".")) < min_length:
+                logger.debug(f"Skipped short segment: '{text}'")
+                continue
+
+            text_lower = text.lower()
+            new_seg["_text_lower"] = text_lower
+            label = classify(text, seg.get("confidence", 0.0), text_lower)
+            new_seg["label"] = label
+            new_seg["label_source"] = "rules"
+            cleaned.append(new_seg)
+
+            if label in EXCLUDE_LABELS:
+                continue
+            filtered.append(new_seg)
+
+            if label in ("action", "instruction") and text:
+                steps.append(text)
+        except Exception as e:
+            logger.error(f"Error processing segment {i}: {e}")
+            continue
+
+    return cleaned, filtered, steps
+
 
 class LLMModel(Protocol):
     """Protocol for LLM model wrappers"""
@@ -53,39 +188,51 @@ def process_transcript(
     """
     logger.info(f"Processing transcript: {transcript_json.get('segment_id')}")
     
-    # Initialize modules
-    cleaner = TextCleaner()
-    classifier = SegmentClassifier(model=model)
+    # Initialize modules; the default cleaner/classifier are shared
+    # singletons so their compiled matchers are built once per process.
+    cleaner = get_default_cleaner()
+    classifier = SegmentClassifier(model=model) if model is not None else get_default_classifier()
     summarizer = Summarizer(model=model)
     stepper = StepExtractor(model=model)
     structurer = DocumentStructurer()
     
     # Execute pipeline
     try:
-        # Step 1: Clean segments
-        logger.info("Step 1/5: Cleaning segments...")
-        cleaned = cleaner.clean_segments(transcript_json.get("segments", []))
-        
-        # Step 2: Classify segments
-        logger.info("Step 2/5: Classifying segments...")
-        classified = classifier.classify_segments(cleaned, use_llm=use_llm)
+        segments = transcript_json.get("segments", [])
 
-        # Filter out non-instructional content such as greetings, farewells and noise.
-        # We intentionally keep questions and other instructional labels.
-        exclude_labels = {"greeting", "farewell", "noise", "irrelevant"}
-        filtered = [s for s in classified if s.get("label") not in exclude_labels]
+        if use_llm and model is not None:
+            # LLM classification needs the whole batch at once, so the
+            # staged path remains.
+            logger.info("Step 1/5: Cleaning segments...")
+            cleaned = cleaner.clean_segments(segments)
+
+            logger.info("Step 2/5: Classifying segments...")
+            classified = classifier.classify_segments(cleaned, use_llm=use_llm)
+
+            # Filter out non-instructional content such as greetings,
+            # farewells and noise. We intentionally keep questions and
+            # other instructional labels.
+            filtered = [s for s in classified if s.get("label") not in EXCLUDE_LABELS]
+            logger.info(f"Filtered {len(classified) - len(filtered)} non-instructional segments")
+
+            logger.info("Step 3/5: Generating summary...")
+            summary = summarizer.summarize_segments(filtered, use_llm=use_llm)
+
+            logger.info("Step 4/5: Extracting steps...")
+            steps = stepper.extract_steps(filtered, use_llm=use_llm)
+        else:
+            # Rule-based: fuse clean + classify + step-collect into one
+            # traversal so each segment's text and dict are touched once.
+            logger.info("Steps 1-2/5: Cleaning and classifying segments (fused)...")
+            cleaned, filtered, raw_steps = _fused_rule_pass(segments, cleaner, classifier)
+            logger.info(f"Filtered {len(cleaned) - len(filtered)} non-instructional segments")
+
+            logger.info("Step 3/5: Generating summary...")
+            summary = summarizer.summarize_segments(filtered, use_llm=use_llm)
+
+            logger.info("Step 4/5: Extracting steps...")
+            steps = stepper._merge_similar_steps(raw_steps)
 
-        logger.info(f"Filtered {len(classified) - len(filtered)} non-instructional segments")
-        
-        # Step 3: Generate summary
-        logger.info("Step 3/5: Generating summary...")
-        # Use filtered, instructional-only segments for summary and step extraction
-        summary = summarizer.summarize_segments(filtered, use_llm=use_llm)
-        
-        # Step 4: Extract steps
-        logger.info("Step 4/5: Extracting steps...")
-        steps = stepper.extract_steps(filtered, use_llm=use_llm)
-        
         # Step 5: Build document
         logger.info("Step 5/5: Building document structure...")
         document = structurer.build_document(
@@ -117,10 +264,15 @@ def export_to_json(document: Dict, output_path: str):
     """
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(document, f, indent=2, ensure_ascii=False)
-    
+
+    if orjson is not None:
+        # OPT_INDENT_2 matches the stdlib indent=2 layout; orjson always
+        # emits UTF-8, mirroring ensure_ascii=False.
+        output_path.write_bytes(orjson.dumps(document, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2, ensure_ascii=False)
+
     logger.info(f"Exported to JSON: {output_path}")
 
 
@@ -137,75 +289,10 @@ def export_to_markdown(document: Dict, output_path: str):
     """
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    md_lines = [
-        f"# {document['title']}",
-        "",
-        "## Summary",
-        document['summary'],
-        "",
-    ]
-    
-    # Add steps if any
-    if document.get('steps'):
-        md_lines.append("## Steps")
-        md_lines.append("")
-        for i, step in enumerate(document['steps'], 1):
-            md_lines.append(f"{i}. {step}")
-        md_lines.append("")
-    
-    # Add key concepts if any
-    if document.get('key_concepts'):
-        md_lines.extend(["## Key Concepts", ""])
-        for concept in document['key_concepts']:
-            md_lines.append(f"- {concept}")
-        md_lines.append("")
-    
-    # Add timeline
-    md_lines.extend([
-        "## Timeline",
-        ""
-    ])
-    
-    for item in document['timeline']:
-        md_lines.append(
-            f"**{item['start_formatted']} - {item['end_formatted']}** "
-            f"[{item['label']}]: {item['text']}"
-        )
-    
-    # Add metadata
-    md_lines.extend([
-        "",
-        "## Metadata",
-        "",
-        f"- **Video ID**: {document['video_id']}",
-        f"- **Language**: {document['metadata'].get('language', 'unknown')}",
-        f"- **Model**: {document['metadata'].get('model', 'unknown')}",
-        f"- **Duration**: {document['metadata'].get('duration', 'unknown')}s",
-        f"- **Processed Segments**: {document['metadata'].get('processed_segments', 0)}",
-        "",
-    ])
-    
-    # Add statistics
-    if document.get('statistics'):
-        stats = document['statistics']
-        md_lines.extend([
-            "## Statistics",
-            "",
-            f"- **Total Segments**: {stats.get('total_segments', 0)}",
-            f"- **Total Words**: {stats.get('total_words', 0)}",
-            f"- **Average Segment Length**: {stats.get('avg_segment_length', 0):.1f} words",
-            "",
-            "### Label Distribution",
-            ""
-        ])
-        
-        for label, count in stats.get('label_distribution', {}).items():
-            md_lines.append(f"- **{label}**: {count}")
-    
+
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("\n".join(md_lines))
-    
+        f.write(_MARKDOWN_TEMPLATE.render(doc=document))
+
     logger.info(f"Exported to Markdown: {output_path}")
 
 
@@ -4,15 +4,28 @@ Classifies transcript segments into categories like action, explanation,
 question, transition, definition, etc.
 """
 
+import functools
 import re
 import logging
 from typing import Dict, List, Optional, Protocol
 
 from .nlp_config import NLPConfig
+from . import keyword_trie
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def get_default_classifier() -> "SegmentClassifier":
+    """Shared rule-based SegmentClassifier over the default rules.
+
+    Classifiers without an LLM model are read-only after init, so one
+    instance can serve every transcript instead of being rebuilt per
+    call.
+    """
+    return SegmentClassifier()
+
+
 class LLMModel(Protocol):
     """Protocol for LLM model wrappers"""
     def generate(self, prompt: str) -> str:
@@ -38,59 +51,59 @@ class SegmentClassifier:
         """
         self.model = model
         self.rules = rules or NLPConfig.CLASSIFICATION_RULES
-        
-    def classify(self, text: str, confidence: float = 0.0) -> str:
+        # One generated trie covers every label's keywords, so classify
+        # finds all keyword hits in a single left-to-right scan. The
+        # default rules share the module-level trie built at import.
+        if rules is None:
+            self._trie = keyword_trie.CLASSIFICATION_TRIE
+        else:
+            self._trie = keyword_trie.build_trie(self.rules)
+
+    def classify(self, text: str, confidence: float = 0.0,
+                 text_lower: Optional[str] = None) -> str:
         """
         Classify a single text segment
-        
+
         Args:
             text: Text to classify
             confidence: Whisper confidence score
-            
+            text_lower: Optional pre-lowercased copy of text; pass it when
+                the caller already holds one to skip the allocation here
+
         Returns:
             Classification label
         """
         if not text:
             return "noise"
-        
-        text_lower = text.lower()
-        
+
         # Check for noise based on confidence and length
         if confidence < NLPConfig.MIN_CONFIDENCE or len(text) < 3:
             return "noise"
 
-        # Check for greetings and farewells first so they can be filtered
-        # out of the document-building pipeline when desired. Use whole-word
-        # matching to avoid accidental substring matches (e.g. 'hi' in 'this').
-        greeting_keywords = self.rules.get("greeting", [])
-        farewell_keywords = self.rules.get("farewell", [])
-
-        def contains_keyword(keyword_list):
-            import re
-
-            for kw in keyword_list:
-                # Use word-boundary search so multi-word and single tokens match
-                pattern = r"\b" + re.escape(kw.lower()) + r"\b"
-                if re.search(pattern, text_lower):
-                    return True
-            return False
-
-        if contains_keyword(greeting_keywords):
-            return "greeting"
-        if contains_keyword(farewell_keywords):
-            return "farewell"
-        
-        # Rule-based classification
-        # Rule-based classification (use whole-word matching as above)
-        for label, keywords in self.rules.items():
-            # Skip greeting/farewell because we handled them above
+        if text_lower is None:
+            text_lower = text.lower()
+
+        # One trie scan yields every keyword hit; the scanner matches
+        # whole words only, so accidental substring hits (e.g. 'hi' in
+        # 'this') are excluded just like the previous \b regexes.
+        found = {label for _, _, label in keyword_trie.scan(self._trie, text_lower)}
+
+        # Greetings and farewells take priority so they can be filtered
+        # out of the document-building pipeline when desired.
+        for label in ("greeting", "farewell"):
+            if label in found:
+                return label
+
+        # Rule-based classification in rules order
+        for label in self.rules:
             if label in ("greeting", "farewell"):
                 continue
-            if contains_keyword(keywords):
+            if label in found:
                 return label
         
-        # Check for questions
-        if text_lower.strip().endswith("?"):
+        # Check for questions; rstrip returns the string itself when there
+        # is no trailing whitespace, which is the common cleaned-text case.
+        if text_lower.rstrip().endswith("?"):
             return "question"
         
         # Default classification
@@ -182,7 +195,8 @@ Respond with only the segment number and label, one per line (e.g., "0. action")
                 new_seg = dict(seg)
                 new_seg["label"] = self.classify(
                     seg.get("text", ""),
-                    seg.get("confidence", 0.0)
+                    seg.get("confidence", 0.0),
+                    text_lower=seg.get("_text_lower")
                 )
                 new_seg["label_source"] = "rules"
                 classified.append(new_seg)
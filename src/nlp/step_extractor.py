@@ -3,7 +3,6 @@ Step Extractor Module
 Extracts actionable steps from transcript segments for documentation
 """
 
-import re
 import logging
 from typing import List, Dict, Optional, Protocol
 
@@ -45,17 +44,21 @@ class StepExtractor:
         """
         if len(steps) <= 1:
             return steps
-        
+
         merged = [steps[0]]
+        last = steps[0].lower()
         for step in steps[1:]:
-            # Check if very similar to last step
-            last = merged[-1].lower()
+            # Exact consecutive repeats are the common case; equality is
+            # far cheaper than the substring containment check below.
             current = step.lower()
-            
+            if current == last:
+                continue
+
             # Simple similarity check
             if current not in last and last not in current:
                 merged.append(step)
-        
+                last = current
+
         return merged
     
     def extract_steps(self, segments: List[Dict], 
@@ -117,9 +120,16 @@ Steps:"""
             List of step strings
         """
         steps = []
-        for line in response.strip().split("\n"):
-            # Remove numbering
-            line = re.sub(r"^\d+\.\s*", "", line).strip()
+        for line in response.split("\n"):
+            # Remove enumeration prefixes ("12. ") with a direct character
+            # scan; no regex machinery per line.
+            i = 0
+            n = len(line)
+            while i < n and line[i].isdigit():
+                i += 1
+            if i and i < n and line[i] == ".":
+                line = line[i + 1:]
+            line = line.strip()
             if line:
                 steps.append(line)
         return steps
@@ -4,7 +4,6 @@ Generates summaries from transcript segments using either rule-based
 methods or LLM-based intelligent summarization
 """
 
-import re
 import logging
 from typing import List, Dict, Optional, Protocol
 
@@ -39,16 +38,25 @@ class Summarizer:
         if not text:
             return ""
 
-        # Split into sentences
-        sentences = re.split(r'(?<=[.!?])\s+', text.strip())
+        text = text.strip()
 
-        # Take first N sentences
-        selected = sentences[:max_sentences]
+        # Bounded scan: walk forward finding sentence-ending punctuation
+        # followed by whitespace and stop after max_sentences hits. This
+        # never materializes the full sentence list the old re.split
+        # allocated, which matters when the combined transcript is long
+        # and max_sentences is small.
+        count = 0
+        i = 0
+        n = len(text)
+        while i < n:
+            if text[i] in ".!?" and i + 1 < n and text[i + 1].isspace():
+                count += 1
+                if count >= max_sentences:
+                    return text[:i + 1]
+            i += 1
 
-        # Join back with ". " (preserve punctuation already present)
-        summary = " ".join(selected).strip()
-
-        return summary
+        # Fewer boundaries than requested: the whole text is the summary.
+        return text
 
     
     def summarize_text(self, passages: List[str], 
@@ -4,14 +4,56 @@ Cleans and normalizes Whisper transcripts by removing filler words,
 normalizing whitespace, and parsing timestamps
 """
 
+import functools
 import re
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from .nlp_config import NLPConfig
+from .keyword_trie import at_word_boundary
+
+try:
+    # Optional: one automaton pass over the text replaces the alternation
+    # regex scan, dropping per-call work to O(len(text)) regardless of how
+    # many filler words are configured.
+    import ahocorasick
+except Exception:  # pragma: no cover - pyahocorasick is optional
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+# Compiled once: clean_text runs these on every segment, so per-call
+# re.sub(pattern_string, ...) compile-cache lookups add up on long
+# transcripts.
+_BRACKET_TAG_RE = re.compile(r"\[.*?\]")
+_DANGLING_PUNCT_RE = re.compile(r"\s+([.,!?])")
+
+
+@functools.lru_cache(maxsize=8)
+def _build_filler_automaton(filler_words: Tuple[str, ...]):
+    """Build (and memoize) an Aho-Corasick automaton over filler words.
+
+    Cached by the filler tuple so repeated TextCleaner construction —
+    one per transcript, or one per test — reuses the compiled automaton.
+    """
+    automaton = ahocorasick.Automaton()
+    for word in filler_words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_cleaner() -> "TextCleaner":
+    """Shared TextCleaner built from the default filler words.
+
+    Construction compiles the filler pattern/automaton, so callers that
+    process one transcript at a time (the web pipeline, tests) should
+    reuse this instance instead of rebuilding it per call. The instance
+    is read-only after init and safe to share across threads.
+    """
+    return TextCleaner()
+
 
 class TextCleaner:
     """Clean and normalize Whisper transcripts"""
@@ -25,12 +67,42 @@ class TextCleaner:
         """
         if filler_words is None:
             filler_words = NLPConfig.DEFAULT_FILLER_WORDS
-        
+
         self.filler_pattern = re.compile(
             r"\b(" + "|".join(map(re.escape, filler_words)) + r")\b",
             flags=re.IGNORECASE
         )
-        
+        # Single-pass scanner preferred over the alternation regex above
+        self._filler_automaton = None
+        if ahocorasick is not None:
+            self._filler_automaton = _build_filler_automaton(
+                tuple(w.lower() for w in filler_words)
+            )
+
+    def _strip_fillers(self, text: str) -> str:
+        """Remove filler words in one automaton pass (regex fallback)."""
+        if self._filler_automaton is None:
+            return self.filler_pattern.sub("", text)
+
+        lower = text.lower()
+        spans = []
+        for end_index, word in self._filler_automaton.iter_long(lower):
+            start = end_index - len(word) + 1
+            end = end_index + 1
+            if at_word_boundary(lower, start - 1, word[0]) and at_word_boundary(lower, end, word[-1]):
+                spans.append((start, end))
+
+        if not spans:
+            return text
+
+        parts = []
+        prev = 0
+        for start, end in spans:
+            parts.append(text[prev:start])
+            prev = end
+        parts.append(text[prev:])
+        return "".join(parts)
+
     def clean_text(self, text: str) -> str:
         if not text or not isinstance(text, str):
             return ""
@@ -38,17 +110,20 @@ class TextCleaner:
         # Strip leading/trailing whitespace
         text = text.strip()
 
-        # Remove bracketed tags like [music], [applause], [noise]
-        text = re.sub(r"\[.*?\]", "", text)
+        # Remove bracketed tags like [music], [applause], [noise]; gate on
+        # a C-level substring check so clean text skips the regex engine.
+        if "[" in text:
+            text = _BRACKET_TAG_RE.sub("", text)
 
         # Remove filler words
-        text = self.filler_pattern.sub("", text)
+        text = self._strip_fillers(text)
 
-        # Normalize whitespace (multiple spaces to single space)
-        text = re.sub(r"\s+", " ", text).strip()
+        # Normalize whitespace (multiple spaces to single space);
+        # split/join runs entirely in C, unlike a \s+ substitution.
+        text = " ".join(text.split())
 
         # Remove standalone punctuation artifacts
-        text = re.sub(r"\s+([.,!?])", r"\1", text)
+        text = _DANGLING_PUNCT_RE.sub(r"\1", text)
 
         # Fix capitalization - only if text is non-empty
         if text and not text[0].isupper():
@@ -71,6 +146,25 @@ class TextCleaner:
             Time in seconds
         """
         try:
+            # Fast path for the fixed-width shapes Whisper emits
+            # ("H:MM:SS" / "M:SS"): index the digits directly instead of
+            # allocating a split list and float-parsing each part.
+            n = len(timestamp)
+            if n == 7 and timestamp[1] == ":" and timestamp[4] == ":" and timestamp.replace(":", "").isdigit():
+                return (
+                    (ord(timestamp[0]) - 48) * 3600
+                    + (ord(timestamp[2]) - 48) * 600
+                    + (ord(timestamp[3]) - 48) * 60
+                    + (ord(timestamp[5]) - 48) * 10
+                    + (ord(timestamp[6]) - 48)
+                )
+            if n == 4 and timestamp[1] == ":" and timestamp.replace(":", "").isdigit():
+                return (
+                    (ord(timestamp[0]) - 48) * 60
+                    + (ord(timestamp[2]) - 48) * 10
+                    + (ord(timestamp[3]) - 48)
+                )
+
             parts = timestamp.split(":")
             if len(parts) == 3:  # H:MM:SS
                 h, m, s = map(float, parts)
@@ -80,7 +174,7 @@ class TextCleaner:
                 return m * 60 + s
             else:
                 return 0.0
-        except (ValueError, AttributeError):
+        except (ValueError, AttributeError, TypeError):
             logger.warning(f"Could not parse timestamp: {timestamp}")
             return 0.0
     
@@ -99,23 +193,32 @@ class TextCleaner:
             return []
         
         cleaned = []
-        
+
+        # Hoisted out of the loop: bound-method and config lookups cost a
+        # dict access per segment otherwise.
+        clean_text = self.clean_text
+        parse_timestamp = self._parse_timestamp
+        min_length = NLPConfig.MIN_SEGMENT_LENGTH
+
         for i, seg in enumerate(segments):
             try:
                 # Create new segment dict
                 new_seg = dict(seg)
-                
+
                 # Clean the text
                 original_text = seg.get("text", "")
-                cleaned_text = self.clean_text(original_text)
+                cleaned_text = clean_text(original_text)
                 new_seg["text"] = cleaned_text
+                # Cached for downstream consumers (classifier, concept
+                # extraction) so the same short string is lowercased once.
+                new_seg["_text_lower"] = cleaned_text.lower()
                 new_seg["original_text"] = original_text
                 
                 # Parse timestamps to seconds
                 start_str = seg.get("start", "0:00:00")
                 end_str = seg.get("end", "0:00:00")
-                new_seg["start_seconds"] = self._parse_timestamp(start_str)
-                new_seg["end_seconds"] = self._parse_timestamp(end_str)
+                new_seg["start_seconds"] = parse_timestamp(start_str)
+                new_seg["end_seconds"] = parse_timestamp(end_str)
                 
                 # Add segment index
                 new_seg["segment_index"] = i
@@ -123,7 +226,7 @@ class TextCleaner:
                 # Only add if segment has meaningful content
                 # Strip the added period to check actual content length
                 content_without_period = cleaned_text.rstrip('.')
-                if len(content_without_period) >= NLPConfig.MIN_SEGMENT_LENGTH:
+                if len(content_without_period) >= min_length:
                     cleaned.append(new_seg)
                 else:
                     logger.debug(f"Skipped short segment: '{cleaned_text}'")
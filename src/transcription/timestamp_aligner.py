@@ -1,6 +1,5 @@
 from pathlib import Path
 import json
-import copy
 from typing import Dict, Any, List
 
 def load_transcript_json(path: str) -> Dict[str, Any]:
@@ -11,28 +10,40 @@ def align_transcript_to_video(transcript: Dict[str, Any], segment_start_in_video
     """
     Adjust per-segment timestamps so they are relative to the original full video.
     """
-    aligned = copy.deepcopy(transcript)
-    for s in aligned.get("segments", []):
+    # Shallow copies are enough: only the segment dicts gain new keys,
+    # so copying the top level and each segment avoids deepcopy's
+    # recursive walk over every string in the transcript.
+    offset = float(segment_start_in_video)
+    aligned = dict(transcript)
+    segments = []
+    for s in transcript.get("segments", []):
+        new_s = dict(s)
         # keep both local and global timestamps
-        s["start_global"] = float(segment_start_in_video) + _to_seconds(s["start"])
-        s["end_global"] = float(segment_start_in_video) + _to_seconds(s["end"])
-    aligned["segment_start_in_video"] = float(segment_start_in_video)
+        new_s["start_global"] = offset + _to_seconds(s["start"])
+        new_s["end_global"] = offset + _to_seconds(s["end"])
+        segments.append(new_s)
+    aligned["segments"] = segments
+    aligned["segment_start_in_video"] = offset
     return aligned
 
 def combine_segment_transcripts(segment_transcripts: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Merge multiple aligned transcripts into one document-level transcript sorted by global time.
     """
+    # Each aligned transcript's segments are already time-ordered, so the
+    # concatenation is a sequence of sorted runs — exactly the shape
+    # Timsort merges in near-linear time.
     all_segments: List[Dict[str, Any]] = []
     for t in segment_transcripts:
-        for s in t.get("segments", []):
-            new_s = dict(s)
-            new_s["segment_id"] = t.get("segment_id")
-            new_s["video_path"] = t.get("video_path")
-            all_segments.append(new_s)
+        sid = t.get("segment_id")
+        path = t.get("video_path")
+        all_segments.extend(
+            dict(s, segment_id=sid, video_path=path)
+            for s in t.get("segments", [])
+        )
 
-    all_segments_sorted = sorted(all_segments, key=lambda x: x.get("start_global", 0.0))
-    return {"combined_segments": all_segments_sorted}
+    all_segments.sort(key=lambda x: x.get("start_global", 0.0))
+    return {"combined_segments": all_segments}
 
 def _to_seconds(ts: str) -> float:
     """Convert HH:MM:SS string back to seconds."""
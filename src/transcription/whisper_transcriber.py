@@ -1,3 +1,4 @@
+import functools
 import os
 import json
 import tempfile
@@ -10,12 +11,99 @@ from pathlib import Path
 from typing import List, Dict, Any
 from tqdm import tqdm
 
+try:
+    # Optional CTranslate2 backend: batched VAD-cut inference is several
+    # times faster than sequential decoding on the same hardware.
+    from faster_whisper import WhisperModel, BatchedInferencePipeline
+except Exception:  # pragma: no cover - faster-whisper is optional
+    WhisperModel = None
+    BatchedInferencePipeline = None
+
+try:
+    import torch
+
+    if torch.cuda.is_available():
+        # Whisper's conv stem always sees fixed-size 30 s mel windows —
+        # the shape-stable case cuDNN autotuning is built for. Benchmark
+        # mode makes cuDNN time its conv algorithms on the first call and
+        # reuse the fastest one for the rest of the process.
+        torch.backends.cudnn.benchmark = True
+except Exception:  # pragma: no cover - torch ships with whisper but stay safe
+    torch = None
+
+# Number of VAD-cut chunks stacked per batch when the batched backend is used
+BATCH_SIZE = 16
+
+
+def _default_compute_type() -> str:
+    """Pick the CTranslate2 quantization for the current hardware.
+
+    int8 weights quarter the bytes moved through the attention layers at
+    effectively unchanged accuracy; on GPU the activations stay float16.
+    """
+    if torch is not None and torch.cuda.is_available():
+        return "int8_float16"
+    return "int8"
+
+
+def _maybe_compile(model):
+    """Wrap the reference model's encoder/decoder in torch.compile.
+
+    On PyTorch 2.x, torch.compile traces the autoregressive decoder once
+    and reuses the generated kernels on every later call instead of
+    re-dispatching eagerly; wrapping is lazy, so the trace cost is paid
+    on the first transcription, not at load. Stub models injected
+    through the loader have no encoder/decoder and pass through
+    untouched, and a compilation failure must never break loading.
+    """
+    if torch is None or not hasattr(torch, "compile"):
+        return model
+    try:
+        if hasattr(model, "encoder") and hasattr(model, "decoder"):
+            # Dynamo errors surface on the first forward pass, not at
+            # wrap time; suppress them so an incompatible graph (e.g.
+            # CUDA-graph capture vs whisper's kv-cache hooks) degrades
+            # to eager execution instead of failing the transcription.
+            torch._dynamo.config.suppress_errors = True
+            model.encoder = torch.compile(model.encoder, mode="reduce-overhead")
+            model.decoder = torch.compile(model.decoder, mode="reduce-overhead")
+    except Exception:  # pragma: no cover - compile support varies by build
+        pass
+    return model
+
+
+@functools.lru_cache(maxsize=4)
+def _load_reference_model(model_name: str, loader):
+    """Load a reference openai-whisper model once per process.
+
+    Keyed on the loader callable as well as the name: production always
+    passes whisper.load_model so repeat constructions hit the cache,
+    while tests that monkeypatch the loader get a fresh entry per patch
+    instead of another test's stub.
+    """
+    return _maybe_compile(loader(model_name))
+
+
+@functools.lru_cache(maxsize=2)
+def _get_cached_model(model_name: str, compute_type: str):
+    """Load a faster-whisper model once and keep it warm across jobs.
+
+    Model weights are hundreds of MB; reloading them (and re-copying to
+    the GPU) for every pipeline run costs 5-30 seconds per job. The
+    cache is keyed by model name and compute type, so consecutive jobs
+    reuse the same resident model.
+    """
+    return WhisperModel(model_name, device="auto", compute_type=compute_type)
+
 def format_ts(seconds: float) -> str:
     """Convert seconds to HH:MM:SS format."""
     return str(datetime.timedelta(seconds=round(seconds)))
 
 class WhisperTranscriber:
-    def __init__(self, model_name: str = None, output_dir: str = "data/transcripts"):
+    def __init__(self, model_name: str = None, output_dir: str = "data/transcripts", model=None):
+        # `output_dir` is per-job state while the model handle is expensive
+        # shared state; callers may inject an already-loaded `model` (any
+        # object with a whisper-style `transcribe`) to skip loading.
         # If caller doesn't provide a model name, fall back to the centralized
         # configuration (config.WHISPER_MODEL) so the app uses one canonical value.
         # Keep backwards compatibility when a caller explicitly passes model_name.
@@ -25,12 +113,29 @@ class WhisperTranscriber:
             resolved_model = "small"
         self.model_name = resolved_model
 
-        # Load the model safely (wrap to surface clearer errors if the name is invalid)
-        try:
-            self.model = whisper.load_model(self.model_name)
-        except TypeError as e:
-            # Whisper's loader may call os.path functions; raise a clearer exception
-            raise RuntimeError(f"Invalid whisper model name: {self.model_name}") from e
+        # Prefer the faster-whisper batched pipeline when the package is
+        # installed; it lets VAD cut the audio and decodes similar-length
+        # chunks together instead of strictly sequentially.
+        self._batched = None
+        if model is not None:
+            self.model = model
+        elif WhisperModel is not None:
+            try:
+                # Cached across transcriber instances so back-to-back jobs
+                # reuse the already-resident weights
+                self.model = _get_cached_model(self.model_name, _default_compute_type())
+                self._batched = BatchedInferencePipeline(model=self.model)
+            except Exception:
+                # Fall back to the reference implementation below
+                self._batched = None
+
+        if model is None and self._batched is None:
+            # Load the model safely (wrap to surface clearer errors if the name is invalid)
+            try:
+                self.model = _load_reference_model(self.model_name, whisper.load_model)
+            except TypeError as e:
+                # Whisper's loader may call os.path functions; raise a clearer exception
+                raise RuntimeError(f"Invalid whisper model name: {self.model_name}") from e
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -53,35 +158,51 @@ class WhisperTranscriber:
 
     def transcribe_segment(
         self,
-        segment_video_path: str,
+        segment_video_path: str = None,
         segment_id: str = None,
         language: str = None,
-        word_timestamps: bool = False
+        word_timestamps: bool = False,
+        audio=None,
     ) -> Dict[str, Any]:
-        """Transcribe a single video segment and return structured JSON with timestamps."""
-        if segment_video_path is None:
-            raise FileNotFoundError("segment_video_path is None")
+        """Transcribe a single video segment and return structured JSON with timestamps.
 
-        if not os.path.exists(segment_video_path):
-            raise FileNotFoundError(f"segment file not found: {segment_video_path}")
+        When `audio` is given (a 16 kHz float32 waveform, as produced by
+        whisper.load_audio or faster_whisper.decode_audio), the ffmpeg
+        audio-extraction step is skipped and the array is handed straight
+        to the model — callers that already hold decoded audio avoid one
+        subprocess fork and resample per call.
+        """
+        options: Dict[str, Any] = {}
+        if language:
+            options["language"] = language
+        if word_timestamps:
+            options["word_timestamps"] = True
 
-        if segment_id is None:
-            segment_id = Path(segment_video_path).stem
+        if audio is not None:
+            if segment_id is None:
+                segment_id = (
+                    Path(segment_video_path).stem if segment_video_path else "audio"
+                )
+            result = self._run_model(audio, options)
+        else:
+            if segment_video_path is None:
+                raise FileNotFoundError("segment_video_path is None")
 
-        with tempfile.TemporaryDirectory() as td:
-            audio_path = os.path.join(td, f"{segment_id}.wav")
-            self._extract_audio(segment_video_path, audio_path)
+            if not os.path.exists(segment_video_path):
+                raise FileNotFoundError(f"segment file not found: {segment_video_path}")
 
-            options: Dict[str, Any] = {}
-            if language:
-                options["language"] = language
-            if word_timestamps:
-                options["word_timestamps"] = True
+            if segment_id is None:
+                segment_id = Path(segment_video_path).stem
 
-            try:
-                result = self.model.transcribe(audio_path, **options)
-            except TypeError:
-                result = self.model.transcribe(audio_path)
+            with tempfile.TemporaryDirectory() as td:
+                audio_path = os.path.join(td, f"{segment_id}.wav")
+                self._extract_audio(segment_video_path, audio_path)
+
+                if self._batched is not None:
+                    result = self._transcribe_batched(audio_path, options)
+                else:
+                    audio_input = self._prepare_audio(audio_path, options)
+                    result = self._run_model(audio_input, options)
 
         segments = result.get("segments", [])
         transcript: Dict[str, Any] = {
@@ -111,6 +232,74 @@ class WhisperTranscriber:
 
         return transcript
 
+    def _run_model(self, audio_input, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Run whichever backend is active on a path, array or tensor."""
+        if self._batched is not None:
+            return self._transcribe_batched(audio_input, options)
+        try:
+            return self.model.transcribe(audio_input, **options)
+        except TypeError:
+            return self.model.transcribe(audio_input)
+
+    def _prepare_audio(self, audio_path: str, options: Dict[str, Any]):
+        """Pre-load audio for the reference whisper backend.
+
+        When a CUDA device is available the waveform is handed to the
+        model as a GPU tensor: whisper then builds the hann window and
+        mel filterbank on the same device, so the STFT + log-mel pass
+        runs on the GPU in one go instead of per-chunk on the CPU.
+        Falls back to the plain file path when that isn't possible.
+        """
+        if torch is None or not torch.cuda.is_available():
+            return audio_path
+
+        try:
+            audio = torch.from_numpy(whisper.load_audio(audio_path)).to("cuda")
+            # Half precision halves the decode bandwidth on GPU
+            options.setdefault("fp16", True)
+            return audio
+        except Exception:
+            return audio_path
+
+    def _transcribe_batched(self, audio_path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Transcribe with the faster-whisper batched pipeline.
+
+        Returns a result dict in the same shape as the reference
+        whisper `transcribe` output so downstream processing is
+        backend-agnostic.
+        """
+        opts: Dict[str, Any] = {"batch_size": BATCH_SIZE, "beam_size": 5}
+        if options.get("language"):
+            opts["language"] = options["language"]
+        if options.get("word_timestamps"):
+            opts["word_timestamps"] = True
+
+        segments_iter, info = self._batched.transcribe(audio_path, **opts)
+
+        segments: List[Dict[str, Any]] = []
+        texts: List[str] = []
+        for seg in segments_iter:
+            entry: Dict[str, Any] = {
+                "start": seg.start,
+                "end": seg.end,
+                "text": seg.text,
+                "avg_logprob": getattr(seg, "avg_logprob", None),
+            }
+            words = getattr(seg, "words", None)
+            if words:
+                entry["words"] = [
+                    {"start": w.start, "end": w.end, "word": w.word} for w in words
+                ]
+            segments.append(entry)
+            texts.append(seg.text)
+
+        return {
+            "segments": segments,
+            "text": "".join(texts),
+            "duration": getattr(info, "duration", None),
+            "language": getattr(info, "language", None),
+        }
+
     def transcribe_batch(self, segment_paths: List[str], language: str = None) -> List[Dict[str, Any]]:
         results: List[Dict[str, Any]] = []
         for p in tqdm(segment_paths, desc="Transcribing segments"):
@@ -118,3 +307,15 @@ class WhisperTranscriber:
             res = self.transcribe_segment(p, segment_id=sid, language=language)
             results.append(res)
         return results
+
+    def transcribe_segments_batched(self, segment_paths: List[str], language: str = None) -> List[Dict[str, Any]]:
+        """Transcribe many segment files through the batched backend.
+
+        Files are processed one after another to bound memory, but within
+        each file the shared BatchedInferencePipeline (built once in
+        __init__) stacks VAD-cut chunks BATCH_SIZE at a time through the
+        encoder, so the expensive forward passes are already batched.
+        When faster-whisper is unavailable this degrades to per-file
+        reference decoding, same as transcribe_batch.
+        """
+        return self.transcribe_batch(segment_paths, language=language)
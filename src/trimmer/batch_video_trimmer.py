@@ -48,9 +48,13 @@ Return format (per file):
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 from .video_trimmer import VideoTrimmer
 
+# Upper bound on concurrent ffmpeg runs; each one is itself multi-threaded
+_MAX_TRIM_WORKERS = 4
+
 
 class BatchVideoTrimmer:
     """Batch-process videos in a directory using `VideoTrimmer`.
@@ -124,43 +128,51 @@ class BatchVideoTrimmer:
         
         if verbose:
             print(f"Found {len(files)} video(s) to process")
-        
-        results = {}
-        
-        for idx, filename in enumerate(files, 1):
+
+        def process_one(filename: str) -> Dict:
             full_path = os.path.join(self.input_dir, filename)
-            
-            if verbose:
-                print(f"[{idx}/{len(files)}] Processing: {filename}")
-            
             try:
                 segments = self.trimmer.auto_segment(
-                    full_path, 
-                    threshold=threshold, 
+                    full_path,
+                    threshold=threshold,
                     min_length=min_length
                 )
-                
-                results[filename] = {
+                return {
                     "status": "success",
                     "segments": segments,
                     "error": None,
                     "segment_count": len(segments)
                 }
-                
-                if verbose:
-                    print(f"  ✓ Created {len(segments)} segment(s)")
-                    
             except Exception as e:
-                results[filename] = {
+                return {
                     "status": "error",
                     "segments": None,
                     "error": str(e),
                     "segment_count": 0
                 }
-                
-                if verbose:
-                    print(f"  ✗ Error: {e}")
-        
+
+        # Each file's scene detection and trimming runs in ffmpeg
+        # subprocesses, which release the GIL while Python waits, so a
+        # thread pool gets full parallelism without the pickling and
+        # fork cost of a process pool. Segment filenames are uuid-based,
+        # so concurrent trims never collide in output_dir.
+        max_workers = min(len(files), _MAX_TRIM_WORKERS, os.cpu_count() or 2)
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(process_one, files))
+        else:
+            outcomes = [process_one(f) for f in files]
+
+        results = {}
+        for idx, (filename, result) in enumerate(zip(files, outcomes), 1):
+            results[filename] = result
+            if verbose:
+                print(f"[{idx}/{len(files)}] Processed: {filename}")
+                if result["status"] == "success":
+                    print(f"  ✓ Created {result['segment_count']} segment(s)")
+                else:
+                    print(f"  ✗ Error: {result['error']}")
+
         return results
     
     def process_single(
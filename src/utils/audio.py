@@ -0,0 +1,83 @@
+"""Cheap audio-presence checks used to gate expensive transcription.
+
+Loading a Whisper model and decoding a full video costs seconds to
+minutes; for screen recordings with no narration that work produces an
+empty transcript anyway. A single ffmpeg `silencedetect` pass over the
+audio track (or noticing there is no audio track at all) lets the
+pipeline skip transcription entirely for silent inputs.
+"""
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+
+import ffmpeg
+
+# silencedetect tuning: anything below this level for at least this many
+# seconds counts as silence.
+_SILENCE_NOISE = "-40dB"
+_SILENCE_MIN_SECONDS = 1.0
+
+# Slack (seconds) allowed between total silence and total duration before
+# a video is still considered to contain speech.
+_SPEECH_SLACK_SECONDS = 0.5
+
+_SILENCE_START_RE = re.compile(r"silence_start:\s*([\d.]+)")
+_SILENCE_END_RE = re.compile(r"silence_end:\s*([\d.]+)")
+
+
+def has_speech(video_path: str) -> bool:
+    """Return True when the video plausibly contains speech.
+
+    Returns False only in the clear-cut cases: the container has no
+    audio stream, or silencedetect reports silence covering effectively
+    the entire duration. Any probe or ffmpeg failure errs on the side of
+    True so transcription is never skipped by accident.
+    """
+    if video_path is None:
+        raise FileNotFoundError("video_path is None")
+
+    if not os.path.exists(video_path):
+        raise FileNotFoundError(f"Input video not found: {video_path}")
+
+    try:
+        info = ffmpeg.probe(video_path)
+    except Exception:
+        return True
+
+    streams = info.get("streams", [])
+    if not any(s.get("codec_type") == "audio" for s in streams):
+        return False
+
+    try:
+        duration = float(info.get("format", {}).get("duration", 0.0) or 0.0)
+    except (TypeError, ValueError):
+        duration = 0.0
+    if duration <= 0:
+        return True
+
+    cmd = [
+        "ffmpeg", "-i", video_path,
+        "-af", f"silencedetect=noise={_SILENCE_NOISE}:d={_SILENCE_MIN_SECONDS}",
+        "-f", "null", "-",
+    ]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+    except (OSError, subprocess.SubprocessError):
+        return True
+    if proc.returncode != 0:
+        return True
+
+    # silencedetect logs to stderr; pair up start/end marks and sum them.
+    starts = [float(m) for m in _SILENCE_START_RE.findall(proc.stderr)]
+    ends = [float(m) for m in _SILENCE_END_RE.findall(proc.stderr)]
+    if not starts:
+        return True
+
+    # A trailing silence may have no end mark; close it at the duration.
+    if len(ends) < len(starts):
+        ends.append(duration)
+
+    silent_total = sum(max(0.0, e - s) for s, e in zip(starts, ends))
+    return silent_total < duration - _SPEECH_SLACK_SECONDS
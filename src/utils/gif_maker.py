@@ -12,7 +12,7 @@ import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 
 import ffmpeg
 
@@ -27,6 +27,67 @@ def _check_gifski_available() -> bool:
     return shutil.which("gifski") is not None
 
 
+# Clips shorter than this go through the ffmpeg-only palette encode even
+# when gifski is present; the PNG-spill + gifski route isn't worth it for
+# a handful of frames.
+_FFMPEG_ONLY_MAX_CLIP_SECONDS = 3.0
+
+
+def make_gif_ffmpeg_only(
+    input_video: str,
+    start_time: float,
+    end_time: float,
+    output_gif: str,
+    fps: Optional[int] = None,
+    width: Optional[int] = None,
+) -> str:
+    """Create a GIF with ffmpeg's two-pass palettegen/paletteuse filters.
+
+    Unlike the gifski route, this decodes the clip once and encodes the
+    GIF in the same process — no PNG frames hit disk and no second
+    subprocess is spawned. Quality is slightly below gifski's but the
+    approach works wherever ffmpeg does.
+
+    Returns the path to the output GIF on success.
+
+    Raises GifGenerationError on failure.
+    """
+    if input_video is None:
+        raise FileNotFoundError("Input video path is None")
+
+    if not os.path.exists(input_video):
+        raise FileNotFoundError(f"Input video not found: {input_video}")
+
+    if fps is None:
+        fps = config.GIFSKI_FPS
+
+    output_gif_path = Path(output_gif)
+    output_gif_path.parent.mkdir(parents=True, exist_ok=True)
+
+    scale = f",scale={width}:-2:flags=lanczos" if width else ""
+    vf = f"fps={fps}{scale},split[a][b];[a]palettegen[p];[b][p]paletteuse"
+
+    cmd = [
+        "ffmpeg", "-y",
+        "-ss", str(start_time), "-to", str(end_time),
+        "-i", input_video,
+        "-vf", vf,
+        str(output_gif_path),
+    ]
+
+    try:
+        subprocess.run(cmd, check=True, capture_output=True)
+    except subprocess.CalledProcessError as e:
+        raise GifGenerationError(f"ffmpeg palette GIF encode failed: {e.stderr.decode(errors='ignore')}")
+    except FileNotFoundError:
+        raise GifGenerationError("ffmpeg binary not found on PATH")
+
+    if not output_gif_path.exists():
+        raise GifGenerationError("Expected GIF output not created")
+
+    return str(output_gif_path)
+
+
 def make_gif_from_clip(
     input_video: str,
     start_time: float,
@@ -38,10 +99,10 @@ def make_gif_from_clip(
 ) -> str:
     """Create a GIF for a short clip between start_time and end_time.
 
-    Steps:
-    1. Create a temporary directory and extract frames from the requested
-       clip using ffmpeg at `fps` frames per second into PNG files.
-    2. Call gifski to convert the PNG sequence into a GIF.
+    ffmpeg decodes the requested clip and streams it straight into
+    gifski over a pipe, so no intermediate frame files ever touch disk.
+    If the piped route fails (e.g. a gifski build without video-over-
+    stdin support), the ffmpeg-only palette encode is used instead.
 
     Returns the path to the output GIF on success.
 
@@ -58,42 +119,193 @@ def make_gif_from_clip(
     if quality is None:
         quality = config.GIFSKI_QUALITY
 
-    if not _check_gifski_available():
-        raise GifGenerationError("gifski binary not found on PATH; please install gifski to use this feature")
+    # Fast path: for very short clips (or when gifski is missing) skip the
+    # PNG-sequence + gifski round-trip and encode directly with ffmpeg.
+    if not _check_gifski_available() or (end_time - start_time) < _FFMPEG_ONLY_MAX_CLIP_SECONDS:
+        return make_gif_ffmpeg_only(input_video, start_time, end_time, output_gif, fps=fps, width=width)
 
     output_gif_path = Path(output_gif)
     output_gif_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Compose ffmpeg command to extract frames to tmpdir/frame%04d.png
-        frame_pattern = os.path.join(tmpdir, "frame%04d.png")
+    # Decode the clip once and feed gifski over a pipe (y4m stream), so
+    # no tens-of-MB PNG sequence is written and read back per clip.
+    vf = f"fps={fps}"
+    if width:
+        vf += f",scale={width}:-2"
 
-        try:
-            stream = (
-                ffmpeg
-                .input(input_video, ss=start_time, to=end_time)
-                .filter('fps', fps=fps)
-                .output(frame_pattern, start_number=0, pix_fmt='rgb24', vframes=9999)
-                .overwrite_output()
-            )
-            stream.run(quiet=True, capture_stderr=True)
-        except ffmpeg.Error as e:
-            raise GifGenerationError(f"ffmpeg failed to extract frames: {getattr(e, 'stderr', str(e))}")
+    ffmpeg_cmd = [
+        "ffmpeg",
+        "-ss", str(start_time), "-to", str(end_time),
+        "-i", input_video,
+        "-vf", vf,
+        "-f", "yuv4mpegpipe", "-pix_fmt", "yuv444p",
+        "-",
+    ]
 
-        # Build gifski command
-        cmd = ["gifski", "-o", str(output_gif_path), os.path.join(tmpdir, "frame*.png")]
-        if width:
-            cmd.extend(["--width", str(width)])
-        if quality:
-            cmd.extend(["--quality", str(quality)])
+    gifski_cmd = ["gifski", "-o", str(output_gif_path), "--fps", str(fps)]
+    if width:
+        gifski_cmd.extend(["--width", str(width)])
+    if quality:
+        gifski_cmd.extend(["--quality", str(quality)])
+    gifski_cmd.append("-")
 
+    try:
+        extractor = subprocess.Popen(ffmpeg_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
         try:
-            # Using shell for glob expansion is simplest and OK for a local tool
-            subprocess.run(" ".join(cmd), shell=True, check=True, capture_output=True)
-        except subprocess.CalledProcessError as e:
-            raise GifGenerationError(f"gifski failed: {e.stderr.decode(errors='ignore')}")
+            encoder = subprocess.run(gifski_cmd, stdin=extractor.stdout, capture_output=True)
+        finally:
+            extractor.stdout.close()
+            extractor.wait()
+
+        if extractor.returncode != 0 or encoder.returncode != 0:
+            raise GifGenerationError(
+                f"piped ffmpeg|gifski failed: {encoder.stderr.decode(errors='ignore')}"
+            )
+    except (GifGenerationError, OSError):
+        # Older gifski builds lack video-over-stdin support; rather than
+        # resurrecting the PNG temp-dir round-trip, use the ffmpeg-only
+        # palette encode which also avoids the disk spill.
+        return make_gif_ffmpeg_only(input_video, start_time, end_time, output_gif, fps=fps, width=width)
 
     if not output_gif_path.exists():
         raise GifGenerationError("Expected GIF output not created")
 
     return str(output_gif_path)
+
+
+def _trim_chain(index: int, start_time: float, end_time: float, fps: int, width: Optional[int]) -> str:
+    """Filter chain that cuts one clip out of a split decoded stream."""
+    chain = f"[v{index}]trim=start={start_time}:end={end_time},setpts=PTS-STARTPTS,fps={fps}"
+    if width:
+        chain += f",scale={width}:-2"
+    return chain
+
+
+def _make_gifs_batch_ffmpeg_only(
+    input_video: str,
+    ranges: Sequence[Tuple[float, float]],
+    out_paths: Sequence[str],
+    fps: int,
+    width: Optional[int],
+) -> List[Optional[str]]:
+    """Encode all clips as GIFs in one ffmpeg run without gifski.
+
+    The decoded stream is split once and each clip gets its own
+    trim + palettegen/paletteuse sub-graph mapped straight to its output
+    GIF, so the source is demuxed and decoded exactly once for N clips.
+    """
+    n = len(ranges)
+    filters = ["[0:v]split={}{}".format(n, "".join(f"[v{i}]" for i in range(n)))]
+    for i, (start_time, end_time) in enumerate(ranges):
+        filters.append(_trim_chain(i, start_time, end_time, fps, width) + f"[c{i}]")
+        filters.append(f"[c{i}]split[a{i}][b{i}];[a{i}]palettegen[p{i}];[b{i}][p{i}]paletteuse[o{i}]")
+
+    cmd = ["ffmpeg", "-y", "-i", input_video, "-filter_complex", ";".join(filters)]
+    for i, out_path in enumerate(out_paths):
+        Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+        cmd.extend(["-map", f"[o{i}]", str(out_path)])
+
+    try:
+        subprocess.run(cmd, check=True, capture_output=True)
+    except subprocess.CalledProcessError as e:
+        raise GifGenerationError(f"ffmpeg batch GIF encode failed: {e.stderr.decode(errors='ignore')}")
+    except FileNotFoundError:
+        raise GifGenerationError("ffmpeg binary not found on PATH")
+
+    return [p if os.path.exists(p) else None for p in map(str, out_paths)]
+
+
+def make_gifs_batch(
+    input_video: str,
+    ranges: Sequence[Tuple[float, float]],
+    out_paths: Sequence[str],
+    fps: Optional[int] = None,
+    width: Optional[int] = None,
+    quality: Optional[int] = None,
+) -> List[Optional[str]]:
+    """Create GIFs for several clips of the same video in one ffmpeg pass.
+
+    Calling `make_gif_from_clip` per clip re-opens and re-seeks the source
+    container for every range, spawning one ffmpeg process per clip. Here we
+    build a single `-filter_complex` graph that splits the decoded stream,
+    trims each requested range and writes every clip's PNG frames in one run,
+    then invoke gifski per clip on its frame directory.
+
+    Args:
+        input_video: Path to the source video.
+        ranges: List of (start_time, end_time) tuples in seconds.
+        out_paths: Output GIF path for each range (same length as ranges).
+
+    Returns a list parallel to `ranges` containing the output GIF path for
+    each clip, or None where encoding failed for that clip.
+
+    Raises GifGenerationError if frame extraction fails.
+    """
+    if input_video is None:
+        raise FileNotFoundError("Input video path is None")
+
+    if not os.path.exists(input_video):
+        raise FileNotFoundError(f"Input video not found: {input_video}")
+
+    if len(ranges) != len(out_paths):
+        raise ValueError("ranges and out_paths must have the same length")
+
+    if not ranges:
+        return []
+
+    if fps is None:
+        fps = config.GIFSKI_FPS
+    if quality is None:
+        quality = config.GIFSKI_QUALITY
+
+    if not _check_gifski_available():
+        # Without gifski, ffmpeg's palette encoder still gives us the
+        # single-decode batch: every clip is cut and encoded in one run.
+        return _make_gifs_batch_ffmpeg_only(input_video, ranges, out_paths, fps, width)
+
+    results: List[Optional[str]] = []
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        n = len(ranges)
+
+        # One split feeding a trim+setpts chain per requested range
+        filters = ["[0:v]split={}{}".format(n, "".join(f"[v{i}]" for i in range(n)))]
+        for i, (start_time, end_time) in enumerate(ranges):
+            filters.append(_trim_chain(i, start_time, end_time, fps, width) + f"[o{i}]")
+
+        cmd = ["ffmpeg", "-y", "-i", input_video, "-filter_complex", ";".join(filters)]
+        clip_dirs = []
+        for i in range(n):
+            clip_dir = os.path.join(tmpdir, f"clip{i:03d}")
+            os.makedirs(clip_dir, exist_ok=True)
+            clip_dirs.append(clip_dir)
+            cmd.extend(["-map", f"[o{i}]", "-pix_fmt", "rgb24", os.path.join(clip_dir, "frame%04d.png")])
+
+        try:
+            subprocess.run(cmd, check=True, capture_output=True)
+        except subprocess.CalledProcessError as e:
+            raise GifGenerationError(f"ffmpeg failed to extract frames: {e.stderr.decode(errors='ignore')}")
+        except FileNotFoundError:
+            raise GifGenerationError("ffmpeg binary not found on PATH")
+
+        # Encode each clip's frame sequence; a gifski failure only skips
+        # that clip so the rest of the batch still completes.
+        for clip_dir, out_path in zip(clip_dirs, out_paths):
+            output_gif_path = Path(out_path)
+            output_gif_path.parent.mkdir(parents=True, exist_ok=True)
+
+            gifski_cmd = ["gifski", "-o", str(output_gif_path), os.path.join(clip_dir, "frame*.png")]
+            if width:
+                gifski_cmd.extend(["--width", str(width)])
+            if quality:
+                gifski_cmd.extend(["--quality", str(quality)])
+
+            try:
+                subprocess.run(" ".join(gifski_cmd), shell=True, check=True, capture_output=True)
+            except subprocess.CalledProcessError:
+                results.append(None)
+                continue
+
+            results.append(str(output_gif_path) if output_gif_path.exists() else None)
+
+    return results
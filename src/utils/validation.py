@@ -5,12 +5,34 @@ project constraints (format, max duration) using existing utilities.
 """
 from __future__ import annotations
 
+import functools
 import os
-from typing import List, Tuple
+from typing import FrozenSet, List, Tuple
 
 from config import config
 import ffmpeg
 
+# Frozen at import so per-upload checks don't chase config attributes;
+# frozenset also gives O(1) membership regardless of how many formats
+# are configured.
+_ALLOWED_FORMATS = frozenset(config.ALLOWED_UPLOAD_FORMATS)
+
+# ffprobe reports container names rather than extensions (an .mp4 file
+# probes as "mov,mp4,m4a,3gp,3g2,mj2"); map each allowed extension to the
+# container names it may legitimately probe as.
+_FORMAT_NAME_EQUIVALENTS = {
+    "mp4": {"mp4", "mov", "m4a", "3gp", "3g2", "mj2"},
+    "mov": {"mov", "mp4", "m4a", "3gp", "3g2", "mj2"},
+    "webm": {"webm", "matroska"},
+    "mkv": {"matroska", "webm"},
+    "avi": {"avi"},
+    "flv": {"flv"},
+}
+
+_ALLOWED_CONTAINER_NAMES = frozenset().union(
+    *(_FORMAT_NAME_EQUIVALENTS.get(fmt, {fmt}) for fmt in _ALLOWED_FORMATS)
+)
+
 
 def is_allowed_format(path: str) -> bool:
     """Return True if the file's extension is in allowed formats.
@@ -19,26 +41,52 @@ def is_allowed_format(path: str) -> bool:
     validation step during upload.
     """
     ext = os.path.splitext(path)[1].lower().lstrip('.')
-    return ext in config.ALLOWED_UPLOAD_FORMATS
+    return ext in _ALLOWED_FORMATS
 
 
-def get_video_duration(path: str) -> float:
-    """Return the video duration in seconds using ffmpeg probe.
+def probe_video_info(path: str) -> Tuple[float, FrozenSet[str]]:
+    """Probe a video once and return (duration_seconds, container names).
 
-    Raises a RuntimeError if probing fails.
+    The single ffprobe call already reports the actual container format
+    alongside the duration, so callers can validate both without a second
+    probe. Raises a RuntimeError if probing fails.
     """
     if path is None:
         raise FileNotFoundError("Input path is None")
 
     if not os.path.exists(path):
         raise FileNotFoundError(f"Input file not found: {path}")
+
+    stat = os.stat(path)
+    return _probe_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_cached(path: str, mtime_ns: int, size: int) -> Tuple[float, FrozenSet[str]]:
+    """Memoized probe keyed by file version.
+
+    Each probe forks an ffprobe process whose startup dwarfs the metadata
+    read; re-validating an unchanged file (same path, mtime and size)
+    returns the cached result instead. Failures are raised, not cached.
+    """
     try:
         probe = ffmpeg.probe(path)
-        return float(probe['format']['duration'])
+        fmt = probe['format']
+        duration = float(fmt['duration'])
+        format_names = frozenset(fmt.get('format_name', '').split(','))
+        return duration, format_names
     except Exception as e:
         raise RuntimeError(f"Could not probe video duration: {e}")
 
 
+def get_video_duration(path: str) -> float:
+    """Return the video duration in seconds using ffmpeg probe.
+
+    Raises a RuntimeError if probing fails.
+    """
+    return probe_video_info(path)[0]
+
+
 def validate_video(path: str) -> Tuple[bool, List[str]]:
     """Validate file path for upload constraints.
 
@@ -55,15 +103,21 @@ def validate_video(path: str) -> Tuple[bool, List[str]]:
         problems.append("file_not_found")
         return False, problems
 
-    if not is_allowed_format(path):
-        problems.append("invalid_format")
-
+    # A single probe yields both the real container format and the
+    # duration; when it succeeds we trust it over the file extension.
     try:
-        dur = get_video_duration(path)
+        dur, format_names = probe_video_info(path)
     except Exception:
         problems.append("duration_unreadable")
+        # Without a probe result fall back to the extension check so the
+        # caller still learns about a disallowed format.
+        if not is_allowed_format(path):
+            problems.insert(0, "invalid_format")
         return False, problems
 
+    if not (format_names & _ALLOWED_CONTAINER_NAMES):
+        problems.append("invalid_format")
+
     if dur > config.MAX_VIDEO_DURATION_SECONDS:
         problems.append("duration_too_long")
 
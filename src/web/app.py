@@ -1,15 +1,34 @@
+import atexit
+import concurrent.futures
+import gzip
+import hashlib
 import json
 import os
+import queue
+import shutil
+import threading
 import uuid
 import logging
 from pathlib import Path
 from typing import Optional
 
+import jinja2
+
+from starlette.concurrency import run_in_threadpool
+
 from fastapi import FastAPI, UploadFile, Request, File, HTTPException
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi.responses import (
+    FileResponse,
+    HTMLResponse,
+    JSONResponse,
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from fastapi.background import BackgroundTasks
+from fastapi.middleware.gzip import GZipMiddleware
 
 from ..frame_detection.clip_detector import detect_action_clips
 from ..transcription.whisper_transcriber import WhisperTranscriber
@@ -19,13 +38,67 @@ from ..nlp.pipeline import (
     export_to_markdown,
     export_to_html,
 )
-from ..utils.gif_maker import make_gif_from_clip, GifGenerationError
+from ..utils.audio import has_speech
+from ..utils.gif_maker import make_gif_from_clip, make_gifs_batch, GifGenerationError
 from config import config
 from .routes import router as web_router
+from . import tasks
+from .status_store import create_status_store
+
+try:
+    import orjson  # much faster (de)serialization for hot status files
+except Exception:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:
+    # Preferred for the fixed status record: msgspec's C encoder beats
+    # even orjson on small flat dicts like ours.
+    from msgspec import json as msgspec_json
+except Exception:  # pragma: no cover - msgspec is optional
+    msgspec_json = None
+
+try:
+    # Optional: libuv-backed event loop roughly halves asyncio callback
+    # overhead. Installed as a policy so uvicorn (and anything else that
+    # creates a loop in this process) picks it up.
+    import asyncio
+
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except Exception:  # pragma: no cover - uvloop is optional/Unix-only
+    pass
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+
+def _dump_status_file(p: Path, data: dict) -> None:
+    """Serialize a status dict to disk (msgspec > orjson > stdlib json)."""
+    if msgspec_json is not None:
+        p.write_bytes(msgspec_json.encode(data))
+    elif orjson is not None:
+        p.write_bytes(orjson.dumps(data))
+    else:
+        p.write_text(json.dumps(data))
+
+
+def _load_status_file(p: Path) -> dict:
+    """Deserialize a status dict from disk (msgspec > orjson > stdlib json)."""
+    if msgspec_json is not None:
+        return msgspec_json.decode(p.read_bytes())
+    if orjson is not None:
+        return orjson.loads(p.read_bytes())
+    return json.loads(p.read_text())
+
+# orjson serializes responses several times faster than stdlib json and
+# without extra whitespace; fall back to JSONResponse when not installed.
+_JSON_RESPONSE_CLASS = JSONResponse if orjson is None else ORJSONResponse
+
+app = FastAPI(default_response_class=_JSON_RESPONSE_CLASS)
+
+# HTML/JSON documentation compresses 4-10x; compressing dynamic
+# responses above 1KB halves-or-better the bytes on the wire.
+app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 # Expose small programmatic API surface for health checks, etc.
 app.include_router(web_router, prefix="/api")
@@ -33,41 +106,103 @@ app.include_router(web_router, prefix="/api")
 # Resolve directories relative to the project root so the app works whether
 # it's launched from the repository root or via `python -m src.main`
 BASE_DIR = Path(__file__).resolve().parents[2]
-templates = Jinja2Templates(directory=str(BASE_DIR / "src" / "web" / "templates"))
+
+# Compile templates once and persist the bytecode across restarts; with
+# auto_reload off outside DEBUG, renders skip the per-request stat check.
+# The default FileSystemBytecodeCache location is a per-uid directory with
+# ownership and mode checks — a fixed path in the shared temp dir would
+# let another local user pre-plant cache entries that get unmarshalled.
+_template_env = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(str(BASE_DIR / "src" / "web" / "templates")),
+    autoescape=True,
+    auto_reload=bool(config.DEBUG),
+    bytecode_cache=jinja2.FileSystemBytecodeCache(),
+)
+templates = Jinja2Templates(env=_template_env)
 app.mount("/static", StaticFiles(directory=str(BASE_DIR / "src" / "web" / "static")), name="static")
 
 UPLOAD_DIR = BASE_DIR / "uploads"
 OUTPUT_DIR = BASE_DIR / "output"
 JOB_DIR = Path("/tmp/jobs")
 
+# One shared pool for the pipeline's parallelizable helpers (GIF encode
+# subprocesses, artifact exports). A module-level executor keeps warm
+# threads across jobs instead of paying pool setup/teardown per stage.
+_SHARED_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(8, (os.cpu_count() or 2) * 2),
+    thread_name_prefix="pipeline",
+)
+
 for p in (UPLOAD_DIR, OUTPUT_DIR, JOB_DIR):
     p.mkdir(parents=True, exist_ok=True)
 
 
 @app.get("/", response_class=HTMLResponse)
 def index(request: Request):
-    return templates.TemplateResponse("upload.html", {"request": request})
+    return templates.TemplateResponse(request, "upload.html")
 
 
 @app.get("/progress/{job_id}", response_class=HTMLResponse)
 def progress(request: Request, job_id: str):
-    return templates.TemplateResponse("progress.html", {"request": request, "job_id": job_id})
+    return templates.TemplateResponse(request, "progress.html", {"job_id": job_id})
+
+
+# Uploads are copied to disk in fixed-size chunks so peak memory stays
+# O(chunk) instead of O(filesize).
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+class _UploadTooLargeError(Exception):
+    """Raised when a streamed upload exceeds the configured size cap."""
+
+
+def _copy_limited(src, dst, limit: int, chunk_size: int = _UPLOAD_CHUNK_SIZE) -> int:
+    """Chunked file copy that aborts once `limit` bytes have arrived.
+
+    The Content-Length pre-check handles honest clients; this guards
+    against chunked or mislabelled requests without ever buffering more
+    than one chunk.
+    """
+    total = 0
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            return total
+        total += len(chunk)
+        if total > limit:
+            raise _UploadTooLargeError(total)
+        dst.write(chunk)
 
 
 @app.post("/upload/")
-async def upload_video(video: UploadFile = File(...), background_tasks: BackgroundTasks = None):
+async def upload_video(request: Request, video: UploadFile = File(...), background_tasks: BackgroundTasks = None):
     """Upload a video and kick off asynchronous processing.
 
     This endpoint returns a job id which can be polled via /status/{job_id}
     and the user redirected to /progress/{job_id} for the UI.
     """
+    # Reject oversize uploads from the declared length before storing bytes
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > config.MAX_UPLOAD_SIZE_BYTES:
+        raise HTTPException(status_code=413, detail="Upload too large")
+
     job_id = str(uuid.uuid4())
     safe_name = Path(video.filename).name if video.filename else "upload"
     input_path = UPLOAD_DIR / f"{job_id}_{safe_name}"
 
     try:
-        body = await video.read()
-        input_path.write_bytes(body)
+        # Stream to disk off the event loop thread so a multi-GB upload
+        # neither buffers fully in RAM nor stalls concurrent requests.
+        with input_path.open("wb") as dst:
+            await run_in_threadpool(
+                _copy_limited, video.file, dst, config.MAX_UPLOAD_SIZE_BYTES
+            )
+    except _UploadTooLargeError:
+        try:
+            input_path.unlink()
+        except Exception:
+            pass
+        raise HTTPException(status_code=413, detail="Upload too large")
     except Exception as exc:  # pragma: no cover - defensive
         logger.exception("Failed to save uploaded file: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to save uploaded file")
@@ -93,25 +228,108 @@ async def upload_video(video: UploadFile = File(...), background_tasks: Backgrou
 
     # create initial status
     status_path = JOB_DIR / f"{job_id}.json"
-    status_path.write_text(json.dumps({"status": "queued", "phase": "Waiting", "progress": 0}))
+    _dump_status_file(status_path, {"status": "queued", "phase": "Waiting", "progress": 0})
 
-    # Launch background work
-    background_tasks.add_task(run_pipeline, job_id, str(input_path))
+    # Launch background work: prefer the out-of-process worker queue when
+    # one is configured so heavy ffmpeg/Whisper work doesn't starve this
+    # server's HTTP handlers; otherwise fall back to in-process tasks.
+    if not tasks.enqueue(job_id, str(input_path)):
+        background_tasks.add_task(run_pipeline, job_id, str(input_path))
 
-    return JSONResponse({"job_id": job_id})
+    return _JSON_RESPONSE_CLASS({"job_id": job_id})
 
 
-def _write_status(job_id: str, *, status: str, phase: Optional[str] = None, progress: Optional[int] = None, error_message: Optional[str] = None, error_trace: Optional[str] = None):
+# Shared status backend (Redis) when configured; None selects the
+# in-process store below.
+_STATUS_STORE = create_status_store()
+
+# In-memory job status store: progress ticks land here and are flushed to
+# disk at most once per second per job instead of rewriting the JSON file
+# on every update. Terminal states flush immediately so error/completion
+# info is always durable by the time the pipeline returns.
+_JOB_STATUS: dict = {}
+_PENDING_FLUSH: dict = {}
+_STATUS_LOCK = threading.Lock()
+_STATUS_FLUSH_SECONDS = 1.0
+_TERMINAL_STATUSES = ("completed", "error")
+
+
+def _flush_status(job_id: str) -> None:
+    with _STATUS_LOCK:
+        timer = _PENDING_FLUSH.pop(job_id, None)
+        if timer is not None:
+            timer.cancel()
+        current = _JOB_STATUS.get(job_id)
+
+    if current is None:
+        return
+
     p = JOB_DIR / f"{job_id}.json"
+    try:
+        _dump_status_file(p, current)
+    except Exception:
+        logger.exception("Unable to write status file: %s", p)
+
+
+def _flush_all_statuses() -> None:  # pragma: no cover - exercised at shutdown
+    with _STATUS_LOCK:
+        job_ids = list(_JOB_STATUS)
+    for job_id in job_ids:
+        _flush_status(job_id)
+
+
+atexit.register(_flush_all_statuses)
+
+
+# Open /events/{job_id} connections register a thread-safe queue here;
+# _write_status feeds every listener so the browser learns of phase
+# changes as they happen instead of polling for them.
+_SUBSCRIBERS: dict = {}
+_EVENT_HEARTBEAT_SECONDS = 15.0
+
+
+def _publish_status(job_id: str, current: dict) -> None:
+    with _STATUS_LOCK:
+        listeners = list(_SUBSCRIBERS.get(job_id, ()))
+    for q in listeners:
+        try:
+            q.put_nowait(current)
+        except queue.Full:  # pragma: no cover - slow consumer; drop the tick
+            pass
+
+
+def _write_status(job_id: str, *, status: str, phase: Optional[str] = None, progress: Optional[int] = None, error_message: Optional[str] = None, error_trace: Optional[str] = None):
     current = {"status": status, "phase": phase or "", "progress": progress or 0}
     if error_message:
         current["error_message"] = str(error_message)
     if error_trace:
         current["error_trace"] = str(error_trace)
-    try:
-        p.write_text(json.dumps(current))
-    except Exception:
-        logger.exception("Unable to write status file: %s", p)
+
+    _publish_status(job_id, current)
+
+    if _STATUS_STORE is not None:
+        try:
+            _STATUS_STORE.set(job_id, current)
+            return
+        except Exception:
+            logger.exception("Status store write failed for %s; using local store", job_id)
+
+    terminal = status in _TERMINAL_STATUSES
+    timer = None
+    with _STATUS_LOCK:
+        _JOB_STATUS[job_id] = current
+        if not terminal and job_id not in _PENDING_FLUSH:
+            timer = threading.Timer(_STATUS_FLUSH_SECONDS, _flush_status, args=(job_id,))
+            timer.daemon = True
+            _PENDING_FLUSH[job_id] = timer
+
+    if terminal:
+        _flush_status(job_id)
+        # Completed/errored jobs are served from disk; don't pin them in RAM
+        with _STATUS_LOCK:
+            _JOB_STATUS.pop(job_id, None)
+    elif timer is not None:
+        timer.start()
 
 
 def run_pipeline(job_id: str, input_path: str):
@@ -138,9 +356,29 @@ def run_pipeline(job_id: str, input_path: str):
         _write_status(job_id, status="running", phase="Transcribing", progress=30)
 
         # Step 2: transcribe (it's ok if transcription is not available on the host)
-        transcriber = WhisperTranscriber(output_dir=str(OUTPUT_DIR / job_id / "transcripts"))
-        # Transcribe whole video as a single segment for now
-        transcript = transcriber.transcribe_segment(input_path, segment_id=job_id)
+        # Silent or audio-less videos short-circuit with an empty transcript:
+        # one cheap silencedetect pass saves the whole model load + decode.
+        try:
+            speech_present = has_speech(input_path)
+        except Exception:
+            logger.exception("Speech detection failed for %s; transcribing anyway", input_path)
+            speech_present = True
+
+        if speech_present:
+            transcriber = WhisperTranscriber(output_dir=str(OUTPUT_DIR / job_id / "transcripts"))
+            # Transcribe whole video as a single segment for now
+            transcript = transcriber.transcribe_segment(input_path, segment_id=job_id)
+        else:
+            logger.info("No speech detected in %s; skipping transcription", input_path)
+            transcript = {
+                "segment_id": job_id,
+                "video_path": input_path,
+                "model": None,
+                "duration": None,
+                "language": None,
+                "raw_text": "",
+                "segments": [],
+            }
         _write_status(job_id, status="running", phase="NLP processing", progress=60)
 
         # Step 3: NLP processing
@@ -161,46 +399,90 @@ def run_pipeline(job_id: str, input_path: str):
             timeline = document.get("timeline", []) or []
             clips = detect_action_clips(str(input_path), timeline)
 
+            # Collect all clip ranges first so the whole batch can be
+            # extracted with a single ffmpeg decode pass instead of one
+            # process pair per timeline item.
+            gif_items = []
+            gif_ranges = []
+            gif_out_paths = []
             for idx, (item, clip) in enumerate(zip(timeline, clips)):
                 try:
                     clip_start = float(clip.get("start", 0.0))
                     clip_end = float(clip.get("end", clip_start))
+                except (TypeError, ValueError):
+                    logger.warning("Invalid clip range for timeline item %s; skipping", item)
+                    continue
+
+                gif_items.append(item)
+                gif_ranges.append((clip_start, clip_end))
+                gif_out_paths.append(str(gifs_dir / f"gif_{idx:03d}.gif"))
 
-                    gif_name = f"gif_{idx:03d}.gif"
-                    out_gif = str(gifs_dir / gif_name)
-
-                    # Attempt to make the GIF; this requires gifski to be installed
-                    gif_path = make_gif_from_clip(
-                        str(input_path),
-                        clip_start,
-                        clip_end,
-                        out_gif,
-                        fps=config.GIFSKI_FPS,
-                        width=config.GIFSKI_WIDTH,
-                        quality=config.GIFSKI_QUALITY,
-                    )
-
-                    # store a URL path that the web app can serve so the preview
-                    # HTML can fetch the gif via the /download endpoint.
-                    gif_rel = f"gifs/{os.path.basename(gif_path)}"
-                    item["gif"] = f"/download/{job_id}/{gif_rel}"
-                    created_gifs.append(gif_rel)
-                    # update status with progress (best-effort)
-                    _write_status(job_id, status="running", phase=f"Generating GIFs ({len(created_gifs)} created)", progress=70 + min(20, len(created_gifs)))
-
-                except (GifGenerationError, FileNotFoundError) as e:
-                    # Do not fail pipeline on gif generation issues; log and continue
-                    logger.warning("GIF generation failed for %s: %s", item, e)
+            gif_paths = None
+            try:
+                gif_paths = make_gifs_batch(
+                    str(input_path),
+                    gif_ranges,
+                    gif_out_paths,
+                    fps=config.GIFSKI_FPS,
+                    width=config.GIFSKI_WIDTH,
+                    quality=config.GIFSKI_QUALITY,
+                )
+            except (GifGenerationError, FileNotFoundError) as e:
+                logger.warning("Batch GIF generation unavailable (%s); falling back to per-clip", e)
+
+            if gif_paths is None:
+                # Per-clip fallback; a failed clip is skipped, not fatal.
+                # Each clip shells out to its own ffmpeg/gifski pair, so
+                # encode them concurrently with a bounded thread pool: the
+                # subprocesses do the CPU work, the threads only wait.
+                gif_paths = [None] * len(gif_ranges)
+                if gif_ranges:
+                    futures = {
+                        _SHARED_EXECUTOR.submit(
+                            make_gif_from_clip,
+                            str(input_path),
+                            clip_start,
+                            clip_end,
+                            out_gif,
+                            fps=config.GIFSKI_FPS,
+                            width=config.GIFSKI_WIDTH,
+                            quality=config.GIFSKI_QUALITY,
+                        ): i
+                        for i, ((clip_start, clip_end), out_gif) in enumerate(zip(gif_ranges, gif_out_paths))
+                    }
+                    for fut in concurrent.futures.as_completed(futures):
+                        i = futures[fut]
+                        try:
+                            gif_paths[i] = fut.result()
+                        except (GifGenerationError, FileNotFoundError) as e:
+                            logger.warning("GIF generation failed for %s: %s", gif_out_paths[i], e)
+
+            for item, gif_path in zip(gif_items, gif_paths):
+                if not gif_path:
                     continue
+                # store a URL path that the web app can serve so the preview
+                # HTML can fetch the gif via the /download endpoint.
+                gif_rel = f"gifs/{Path(gif_path).name}"
+                item["gif"] = f"/download/{job_id}/{gif_rel}"
+                created_gifs.append(gif_rel)
+                # update status with progress (best-effort)
+                _write_status(job_id, status="running", phase=f"Generating GIFs ({len(created_gifs)} created)", progress=70 + min(20, len(created_gifs)))
         except Exception:
             logger.exception("Unexpected GIF generation failure; continuing")
 
         # Attach list of created gifs to document metadata to help debugging
         document.setdefault("metadata", {})["created_gifs"] = created_gifs
 
-        export_to_json(document, str(out_dir / "documentation.json"))
-        export_to_markdown(document, str(out_dir / "documentation.md"))
-        export_to_html(document, str(out_dir / "documentation.html"))
+        # The three exports read the same document and never touch each
+        # other's files, so run them concurrently on the shared pool.
+        export_futures = [
+            _SHARED_EXECUTOR.submit(export_to_json, document, str(out_dir / "documentation.json")),
+            _SHARED_EXECUTOR.submit(export_to_markdown, document, str(out_dir / "documentation.md")),
+            _SHARED_EXECUTOR.submit(export_to_html, document, str(out_dir / "documentation.html")),
+        ]
+        for fut in export_futures:
+            fut.result()
+        _write_gzip_variants(out_dir)
 
         _write_status(job_id, status="completed", phase="Complete", progress=100)
 
@@ -213,54 +495,202 @@ def run_pipeline(job_id: str, input_path: str):
         _write_status(job_id, status="error", phase=str(exc), progress=0, error_message=str(exc), error_trace=tb)
 
 
-@app.get("/status/{job_id}")
-def get_status(job_id: str):
+def _current_status(job_id: str) -> dict:
+    """Look up a job's status (shared store > memory > disk).
+
+    Raises HTTPException for unknown jobs or unreadable status files.
+    """
+    if _STATUS_STORE is not None:
+        try:
+            current = _STATUS_STORE.get(job_id)
+        except Exception:
+            logger.exception("Status store read failed for %s", job_id)
+            current = None
+        if current is not None:
+            return current
+
+    # Serve active jobs straight from memory; polls then cost a dict
+    # lookup instead of an open+read+parse per request.
+    with _STATUS_LOCK:
+        current = _JOB_STATUS.get(job_id)
+    if current is not None:
+        return current
+
     p = JOB_DIR / f"{job_id}.json"
     if not p.exists():
         raise HTTPException(status_code=404, detail="Job not found")
 
     try:
-        return json.loads(p.read_text())
+        return _load_status_file(p)
     except Exception as exc:
         logger.exception("Failed to read status for %s: %s", job_id, exc)
         raise HTTPException(status_code=500, detail="Failed to read job status")
 
 
+@app.get("/status/{job_id}")
+def get_status(request: Request, job_id: str):
+    data = _current_status(job_id)
+
+    # Identical progress means an identical body, so let pollers skip the
+    # transfer entirely between transitions. Hash the tuple rather than
+    # interpolating it: phase strings carry spaces and parentheses, which
+    # the RFC 7232 entity-tag grammar forbids inside the quotes.
+    etag_src = f'{data.get("status")}\x00{data.get("phase", "")}\x00{data.get("progress", 0)}'
+    etag = f'W/"{hashlib.sha1(etag_src.encode()).hexdigest()[:16]}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    return _JSON_RESPONSE_CLASS(data, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+@app.get("/events/{job_id}")
+async def status_events(job_id: str):
+    """Stream status updates for a job as Server-Sent Events.
+
+    Each connection gets its own queue fed by _write_status, so the UI
+    receives phase changes as they happen with no idle polling traffic.
+    The stream closes once the job reaches a terminal state.
+    """
+    q: queue.Queue = queue.Queue(maxsize=100)
+    with _STATUS_LOCK:
+        _SUBSCRIBERS.setdefault(job_id, []).append(q)
+
+    def _sse(data: dict) -> str:
+        return f"data: {json.dumps(data)}\n\n"
+
+    async def event_stream():
+        try:
+            # Send the current snapshot first so late subscribers render
+            # immediately instead of waiting for the next transition.
+            try:
+                current = _current_status(job_id)
+            except HTTPException:
+                current = None
+            if current is not None:
+                yield _sse(current)
+                if current.get("status") in _TERMINAL_STATUSES:
+                    return
+
+            while True:
+                try:
+                    current = await run_in_threadpool(q.get, True, _EVENT_HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    # Comment line keeps proxies from timing out an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _sse(current)
+                if current.get("status") in _TERMINAL_STATUSES:
+                    return
+        finally:
+            with _STATUS_LOCK:
+                listeners = _SUBSCRIBERS.get(job_id)
+                if listeners is not None:
+                    try:
+                        listeners.remove(q)
+                    except ValueError:
+                        pass
+                    if not listeners:
+                        _SUBSCRIBERS.pop(job_id, None)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @app.get("/result/{job_id}", response_class=HTMLResponse)
 def result(request: Request, job_id: str):
     html_path = OUTPUT_DIR / job_id / "documentation.html"
     if not html_path.exists():
         raise HTTPException(status_code=404, detail="Result not found")
 
-    preview = html_path.read_text(encoding="utf-8")
-
-    return templates.TemplateResponse("result.html", {"request": request, "job_id": job_id, "preview_html": preview})
+    # The page only renders a small shell; the generated document is
+    # loaded in an iframe straight from /download, which serves the file
+    # with FileResponse (sendfile) instead of reading and re-embedding
+    # potentially megabytes of HTML on every view.
+    return templates.TemplateResponse(request, "result.html", {"job_id": job_id})
 
 
 @app.get("/error/{job_id}", response_class=HTMLResponse)
 def error_page(request: Request, job_id: str):
-    # Read the status file for this job and present detailed error info.
-    p = JOB_DIR / f"{job_id}.json"
-    if not p.exists():
-        raise HTTPException(status_code=404, detail="Job not found")
-
-    try:
-        status = json.loads(p.read_text())
-    except Exception as exc:
-        logger.exception("Failed to read status file for %s: %s", job_id, exc)
-        raise HTTPException(status_code=500, detail="Failed to read job status")
+    # Same store-then-disk lookup as /status: with a shared store enabled
+    # the disk file never advances past "queued", so reading it directly
+    # would hide the error details. 404s when neither source knows the job.
+    status = _current_status(job_id)
 
     # Render an informative error page (show trace only in debug mode)
     return templates.TemplateResponse(
+        request,
         "error.html",
-        {"request": request, "job_id": job_id, "status": status, "debug": bool(config.DEBUG)},
+        {"job_id": job_id, "status": status, "debug": bool(config.DEBUG)},
     )
 
 
-@app.get("/download/{job_id}/{filename}")
-def download(job_id: str, filename: str):
-    path = OUTPUT_DIR / job_id / filename
+# Explicit media types for downloads: with a known type Starlette skips
+# stat+guess and can hand the open file straight to the server's sendfile
+# path for zero-copy transfers.
+_DOWNLOAD_MEDIA_TYPES = {
+    ".mp4": "video/mp4",
+    ".gif": "image/gif",
+    ".html": "text/html",
+    ".json": "application/json",
+    ".md": "text/markdown",
+}
+
+# Text artifacts worth shipping pre-compressed alongside the original
+_GZIP_ARTIFACTS = ("documentation.html", "documentation.json", "documentation.md")
+
+
+def _write_gzip_variants(out_dir: Path) -> None:
+    """Write a `.gz` sibling for each text artifact in `out_dir`.
+
+    Compressing once at export time means /download can hand clients the
+    already-compressed bytes instead of re-gzipping per request.
+    """
+    for name in _GZIP_ARTIFACTS:
+        src = out_dir / name
+        if not src.exists():
+            continue
+        try:
+            with src.open("rb") as fsrc, gzip.open(str(src) + ".gz", "wb", compresslevel=6) as fdst:
+                shutil.copyfileobj(fsrc, fdst)
+        except OSError:
+            logger.exception("Failed to pre-compress %s", src)
+
+
+@app.get("/download/{job_id}/{filename:path}")
+def download(request: Request, job_id: str, filename: str):
+    job_root = (OUTPUT_DIR / job_id).resolve()
+    path = (OUTPUT_DIR / job_id / filename).resolve()
+
+    # Refuse anything that escapes the job's output directory so serving
+    # raw files stays safe.
+    if not path.is_relative_to(job_root):
+        raise HTTPException(status_code=404, detail="File not found")
+
     if not path.exists():
         raise HTTPException(status_code=404, detail="File not found")
 
-    return FileResponse(str(path), filename=filename)
+    media_type = _DOWNLOAD_MEDIA_TYPES.get(path.suffix.lower(), "application/octet-stream")
+
+    # Artifacts are written once per job, so mtime+size make a stable
+    # validator; repeat fetches of an unchanged file cost no body bytes.
+    stat = path.stat()
+    etag = f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    # Prefer the pre-compressed sibling written at export time: the
+    # client gets the same logical file with no per-request compression.
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        gz_path = path.with_name(path.name + ".gz")
+        if gz_path.exists():
+            return FileResponse(
+                str(gz_path),
+                filename=path.name,
+                media_type=media_type,
+                headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding", "ETag": etag},
+            )
+
+    return FileResponse(str(path), filename=path.name, media_type=media_type, headers={"ETag": etag})
@@ -0,0 +1,63 @@
+"""Pluggable backend for job status storage.
+
+By default the app keeps job status in an in-process dict with a
+debounced file flush (see `app._write_status`). That is fine for a
+single worker, but with several uvicorn workers a background task in
+one process would write status that another process's clients never
+see. When a `REDIS_URL` is configured (and the `redis` package is
+installed), status is kept in Redis hashes instead, making
+`/status/{job_id}` an O(1) shared lookup across all workers.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class RedisStatusStore:
+    """Store job status dicts in Redis hashes (`job:{id}`)."""
+
+    def __init__(self, client, ttl_seconds: int = 24 * 3600):
+        self._client = client
+        # Entries expire on their own so finished jobs don't accumulate
+        self._ttl = ttl_seconds
+
+    def set(self, job_id: str, data: dict) -> None:
+        key = f"job:{job_id}"
+        mapping = {k: str(v) for k, v in data.items()}
+        self._client.hset(key, mapping=mapping)
+        self._client.expire(key, self._ttl)
+
+    def get(self, job_id: str):
+        raw = self._client.hgetall(f"job:{job_id}")
+        if not raw:
+            return None
+
+        data = dict(raw)
+        try:
+            data["progress"] = int(data.get("progress", 0))
+        except (TypeError, ValueError):
+            data["progress"] = 0
+        return data
+
+
+def create_status_store():
+    """Build the configured status store, or None for the default path.
+
+    Returns a RedisStatusStore when REDIS_URL is set and reachable;
+    otherwise None so the app falls back to its in-process store.
+    """
+    url = os.getenv("REDIS_URL")
+    if not url:
+        return None
+
+    try:
+        import redis
+
+        client = redis.Redis.from_url(url, decode_responses=True)
+        client.ping()
+        return RedisStatusStore(client)
+    except Exception:
+        logger.warning("REDIS_URL set but Redis unavailable; using in-process status store")
+        return None
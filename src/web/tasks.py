@@ -0,0 +1,67 @@
+"""Optional out-of-process task queue for the processing pipeline.
+
+FastAPI's BackgroundTasks runs `run_pipeline` inside the web server
+process, so ffmpeg, Whisper and gifski block an HTTP worker for minutes
+per job. When Celery is installed and a broker is configured (via the
+`CELERY_BROKER_URL` environment variable), this module exposes the
+pipeline as a Celery task so uploads return immediately and any number
+of separate worker processes chew through jobs:
+
+    celery -A src.web.tasks worker --concurrency=2
+
+When Celery or the broker is absent, `enqueue` reports failure and the
+app falls back to in-process BackgroundTasks, so local development and
+tests need no extra infrastructure.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+try:
+    from celery import Celery
+except Exception:  # pragma: no cover - celery is optional
+    Celery = None
+
+_BROKER_URL = os.getenv("CELERY_BROKER_URL")
+
+celery_app = None
+if Celery is not None and _BROKER_URL:
+    celery_app = Celery(
+        "video_to_document",
+        broker=_BROKER_URL,
+        backend=os.getenv("CELERY_RESULT_BACKEND", _BROKER_URL),
+    )
+
+
+if celery_app is not None:
+    @celery_app.task(name="src.web.tasks.run_pipeline")
+    def run_pipeline_task(job_id: str, input_path: str) -> None:
+        # Imported lazily so the worker doesn't need the import to succeed
+        # at module load and to avoid a circular import with the app.
+        from .app import run_pipeline
+
+        run_pipeline(job_id, input_path)
+
+
+def queue_available() -> bool:
+    """Return True when jobs can be handed to an external worker pool."""
+    return celery_app is not None
+
+
+def enqueue(job_id: str, input_path: str) -> bool:
+    """Send a pipeline job to the worker queue.
+
+    Returns True when the job was queued, False when no queue is
+    configured (callers should then run the pipeline in-process).
+    """
+    if celery_app is None:
+        return False
+
+    try:
+        run_pipeline_task.delay(job_id, input_path)
+        return True
+    except Exception:
+        logger.exception("Failed to enqueue job %s; falling back to in-process run", job_id)
+        return False
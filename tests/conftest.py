@@ -0,0 +1,133 @@
+"""
+Shared pytest fixtures.
+
+The default NLP components are read-only after construction, and building
+them compiles filler automatons / keyword tries. Session-scoped fixtures
+let the whole suite share one instance of each instead of rebuilding them
+per test.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from nlp.text_cleaner import TextCleaner
+from nlp.segment_classifier import SegmentClassifier
+from nlp.summarizer import Summarizer
+from nlp.step_extractor import StepExtractor
+from nlp.doc_structurer import DocumentStructurer
+
+
+SAMPLE_VIDEO = str(Path(__file__).parent / "sample_video.mp4")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "requires_gpu: test needs a CUDA device; deselected automatically on CPU-only hosts",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    try:
+        import torch
+        has_cuda = torch.cuda.is_available()
+    except Exception:
+        has_cuda = False
+    if has_cuda:
+        return
+    skip_gpu = pytest.mark.skip(reason="CUDA GPU not available")
+    for item in items:
+        if "requires_gpu" in item.keywords:
+            item.add_marker(skip_gpu)
+
+
+@pytest.fixture(scope="session")
+def test_video():
+    """
+    Create the shared 10-second test video if it doesn't exist.
+
+    Session-scoped so the encoder runs at most once per pytest
+    invocation; the pattern video has color changes for scene detection.
+    Nothing in the suite checks encoded quality, so intra-only mpeg4
+    (no motion estimation, no CABAC) replaces libx264 — the encode is
+    close to a raw pixel copy while the file stays a playable MP4.
+    """
+    if not os.path.exists(SAMPLE_VIDEO):
+        import ffmpeg
+        try:
+            (
+                ffmpeg
+                .input("testsrc=duration=10:size=640x480:rate=30", f="lavfi")
+                .output(
+                    SAMPLE_VIDEO,
+                    pix_fmt="yuv420p",
+                    vcodec="mpeg4",
+                    t=10,  # Explicitly set duration to 10 seconds
+                    g=1,  # Intra-only: every frame a keyframe
+                    **{"qscale:v": "2"},
+                )
+                .overwrite_output()
+                .run(quiet=True, capture_stderr=True)
+            )
+        except ffmpeg.Error as e:
+            pytest.skip(f"Could not generate test video: {e.stderr.decode()}")
+
+    yield SAMPLE_VIDEO
+
+
+@pytest.fixture(scope="session")
+def tiny_video(tmp_path_factory):
+    """A 2-second 320x240 test clip shared across validation tests.
+
+    Encoded intra-only mpeg4 for the same reason as test_video: the
+    validation tests only probe duration and container format.
+    """
+    path = tmp_path_factory.mktemp("media") / "tiny.mp4"
+    import ffmpeg
+    try:
+        (
+            ffmpeg
+            .input("testsrc=duration=2:size=320x240:rate=15", f="lavfi")
+            .output(str(path), vcodec="mpeg4", pix_fmt="yuv420p", t=2,
+                    g=1, **{"qscale:v": "2"})
+            .overwrite_output()
+            .run(quiet=True, capture_stderr=True)
+        )
+    except ffmpeg.Error:
+        pytest.skip("ffmpeg not available for creating test video")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def cleaner():
+    """Shared default TextCleaner."""
+    return TextCleaner()
+
+
+@pytest.fixture(scope="session")
+def classifier():
+    """Shared default rule-based SegmentClassifier."""
+    return SegmentClassifier()
+
+
+@pytest.fixture(scope="session")
+def summarizer():
+    """Shared rule-based Summarizer (no LLM model)."""
+    return Summarizer()
+
+
+@pytest.fixture(scope="session")
+def extractor():
+    """Shared rule-based StepExtractor (no LLM model)."""
+    return StepExtractor()
+
+
+@pytest.fixture(scope="session")
+def structurer():
+    """Shared DocumentStructurer."""
+    return DocumentStructurer()
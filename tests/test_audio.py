@@ -0,0 +1,67 @@
+import pytest
+
+from src.utils import audio
+
+
+def ffmpeg_available():
+    from shutil import which
+    return which("ffmpeg") is not None and which("ffprobe") is not None
+
+
+def _make_video(path, audio_input=None, duration=3):
+    import ffmpeg
+
+    video = ffmpeg.input(f"testsrc=duration={duration}:size=160x120:rate=10", f="lavfi")
+    try:
+        if audio_input is not None:
+            sound = ffmpeg.input(audio_input, f="lavfi")
+            out = ffmpeg.output(
+                video, sound, str(path),
+                vcodec="libx264", pix_fmt="yuv420p", acodec="aac",
+                t=duration, preset="ultrafast",
+            )
+        else:
+            out = ffmpeg.output(video, str(path), vcodec="libx264", pix_fmt="yuv420p", t=duration, preset="ultrafast")
+        out.overwrite_output().run(quiet=True, capture_stderr=True)
+    except ffmpeg.Error:
+        pytest.skip("ffmpeg not available")
+
+
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+def test_has_speech_false_without_audio_stream(tmp_path):
+    vid = tmp_path / "mute.mp4"
+    _make_video(vid)
+
+    assert audio.has_speech(str(vid)) is False
+
+
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+def test_has_speech_false_for_silent_audio(tmp_path):
+    vid = tmp_path / "silent.mp4"
+    _make_video(vid, audio_input="anullsrc=r=16000:cl=mono")
+
+    assert audio.has_speech(str(vid)) is False
+
+
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+def test_has_speech_true_for_audible_audio(tmp_path):
+    vid = tmp_path / "tone.mp4"
+    _make_video(vid, audio_input="sine=frequency=440:sample_rate=16000")
+
+    assert audio.has_speech(str(vid)) is True
+
+
+def test_has_speech_rejects_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        audio.has_speech(str(tmp_path / "nope.mp4"))
+
+    with pytest.raises(FileNotFoundError):
+        audio.has_speech(None)
+
+
+def test_has_speech_permissive_on_unreadable_input(tmp_path):
+    # Probe failures must never skip transcription
+    vid = tmp_path / "garbage.mp4"
+    vid.write_bytes(b"not a video")
+
+    assert audio.has_speech(str(vid)) is True
@@ -0,0 +1,50 @@
+import os
+import time
+from pathlib import Path
+
+from src.web import cleaner
+
+
+def _age(path: Path, seconds: int) -> None:
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+def test_cleanup_removes_only_stale_entries(tmp_path):
+    stale_file = tmp_path / "old.mp4"
+    stale_file.write_bytes(b"x")
+    _age(stale_file, cleaner.DEFAULT_TTL_SECONDS + 60)
+
+    stale_dir = tmp_path / "old_job"
+    stale_dir.mkdir()
+    (stale_dir / "artifact.gif").write_bytes(b"x")
+    _age(stale_dir, cleaner.DEFAULT_TTL_SECONDS + 60)
+
+    fresh_file = tmp_path / "new.mp4"
+    fresh_file.write_bytes(b"x")
+
+    removed = cleaner.cleanup(paths=[tmp_path])
+
+    assert removed == 2
+    assert not stale_file.exists()
+    assert not stale_dir.exists()
+    assert fresh_file.exists()
+
+
+def test_cleanup_handles_many_stale_entries(tmp_path):
+    for i in range(40):
+        f = tmp_path / f"old_{i}.json"
+        f.write_bytes(b"x")
+        _age(f, cleaner.DEFAULT_TTL_SECONDS + 60)
+
+    assert cleaner.cleanup(paths=[tmp_path]) == 40
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cleanup_skips_missing_paths(tmp_path):
+    assert cleaner.cleanup(paths=[tmp_path / "does-not-exist"]) == 0
+
+
+def test_default_paths_are_computed_once():
+    assert cleaner.BASE_DIR == Path(cleaner.__file__).resolve().parents[2]
+    assert cleaner.DEFAULT_PATHS[-1] == Path("/tmp/jobs")
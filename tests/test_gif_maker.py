@@ -35,3 +35,112 @@ def test_make_gif_from_clip(tmp_path):
     assert os.path.exists(gif_path)
     assert gif_path.endswith(".gif")
     assert os.path.getsize(gif_path) > 0
+
+
+def test_make_gifs_batch_empty_ranges(tmp_path):
+    vid = tmp_path / "v.mp4"
+    vid.write_bytes(b"dummy")
+
+    assert gif_maker.make_gifs_batch(str(vid), [], []) == []
+
+
+def test_make_gifs_batch_length_mismatch(tmp_path):
+    vid = tmp_path / "v.mp4"
+    vid.write_bytes(b"dummy")
+
+    with pytest.raises(ValueError):
+        gif_maker.make_gifs_batch(str(vid), [(0.0, 1.0)], [])
+
+
+@pytest.mark.skipif(not gifski_available(), reason="gifski not installed on host")
+def test_make_gifs_batch(tmp_path):
+    vid = tmp_path / "v.mp4"
+
+    import ffmpeg
+
+    try:
+        (
+            ffmpeg
+            .input("testsrc=duration=4:size=320x240:rate=15", f="lavfi")
+            .output(str(vid), vcodec="libx264", pix_fmt="yuv420p", t=4, preset="ultrafast")
+            .overwrite_output()
+            .run(quiet=True, capture_stderr=True)
+        )
+    except ffmpeg.Error:
+        pytest.skip("ffmpeg not available")
+
+    out_paths = [str(tmp_path / "a.gif"), str(tmp_path / "b.gif")]
+    results = gif_maker.make_gifs_batch(str(vid), [(0.0, 1.0), (2.0, 3.0)], out_paths, fps=10, width=320)
+
+    assert results == out_paths
+    for p in out_paths:
+        assert os.path.getsize(p) > 0
+
+
+def test_make_gifs_batch_without_gifski_uses_single_ffmpeg_pass(tmp_path, monkeypatch):
+    vid = tmp_path / "v.mp4"
+    _make_test_video(vid, duration=4)
+
+    monkeypatch.setattr(gif_maker, "_check_gifski_available", lambda: False)
+
+    out_paths = [str(tmp_path / "a.gif"), str(tmp_path / "b.gif")]
+    results = gif_maker.make_gifs_batch(str(vid), [(0.0, 1.0), (2.0, 3.0)], out_paths, fps=10, width=160)
+
+    assert results == out_paths
+    for p in out_paths:
+        assert os.path.getsize(p) > 0
+
+
+def _make_test_video(path, duration=3):
+    import ffmpeg
+
+    try:
+        (
+            ffmpeg
+            .input(f"testsrc=duration={duration}:size=320x240:rate=15", f="lavfi")
+            .output(str(path), vcodec="libx264", pix_fmt="yuv420p", t=duration, preset="ultrafast")
+            .overwrite_output()
+            .run(quiet=True, capture_stderr=True)
+        )
+    except ffmpeg.Error:
+        pytest.skip("ffmpeg not available")
+
+
+def test_make_gif_ffmpeg_only(tmp_path):
+    vid = tmp_path / "v.mp4"
+    _make_test_video(vid)
+
+    out_gif = tmp_path / "out.gif"
+    gif_path = gif_maker.make_gif_ffmpeg_only(str(vid), 0.0, 1.5, str(out_gif), fps=10, width=160)
+
+    assert os.path.exists(gif_path)
+    assert os.path.getsize(gif_path) > 0
+
+
+def test_make_gif_from_clip_falls_back_without_gifski(tmp_path, monkeypatch):
+    vid = tmp_path / "v.mp4"
+    _make_test_video(vid)
+
+    # Simulate a host without gifski; the ffmpeg-only path should kick in
+    monkeypatch.setattr(gif_maker, "_check_gifski_available", lambda: False)
+
+    out_gif = tmp_path / "out.gif"
+    gif_path = gif_maker.make_gif_from_clip(str(vid), 0.0, 2.0, str(out_gif), fps=10)
+
+    assert os.path.exists(gif_path)
+    assert os.path.getsize(gif_path) > 0
+
+
+def test_make_gif_from_clip_piped_failure_uses_palette_encode(tmp_path, monkeypatch):
+    vid = tmp_path / "v.mp4"
+    _make_test_video(vid, duration=4)
+
+    # Pretend gifski exists so the piped route is attempted; the missing
+    # binary then forces the ffmpeg-only palette fallback.
+    monkeypatch.setattr(gif_maker, "_check_gifski_available", lambda: True)
+
+    out_gif = tmp_path / "out.gif"
+    gif_path = gif_maker.make_gif_from_clip(str(vid), 0.0, 3.5, str(out_gif), fps=10)
+
+    assert os.path.exists(gif_path)
+    assert os.path.getsize(gif_path) > 0
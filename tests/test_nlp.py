@@ -117,39 +117,33 @@ def sample_transcript():
 
 class TestTextCleaner:
     
-    def test_clean_text_removes_filler(self):
-        cleaner = TextCleaner()
+    def test_clean_text_removes_filler(self, cleaner):
         text = "um click the button"
         result = cleaner.clean_text(text)
         assert "um" not in result.lower()
         assert "click the button" in result.lower()
     
-    def test_clean_text_capitalizes(self):
-        cleaner = TextCleaner()
+    def test_clean_text_capitalizes(self, cleaner):
         text = "click the button"
         result = cleaner.clean_text(text)
         assert result[0].isupper()
     
-    def test_clean_text_normalizes_whitespace(self):
-        cleaner = TextCleaner()
+    def test_clean_text_normalizes_whitespace(self, cleaner):
         text = "click    the   button  "
         result = cleaner.clean_text(text)
         assert "  " not in result
         assert result == "Click the button."
     
-    def test_clean_text_adds_period(self):
-        cleaner = TextCleaner()
+    def test_clean_text_adds_period(self, cleaner):
         text = "click the button"
         result = cleaner.clean_text(text)
         assert result.endswith(".")
     
-    def test_clean_text_handles_empty(self):
-        cleaner = TextCleaner()
+    def test_clean_text_handles_empty(self, cleaner):
         assert cleaner.clean_text("") == ""
         assert cleaner.clean_text("   ") == ""
     
-    def test_clean_text_removes_multiple_fillers(self):
-        cleaner = TextCleaner()
+    def test_clean_text_removes_multiple_fillers(self, cleaner):
         text = "um you know like click the button"
         result = cleaner.clean_text(text)
         assert "um" not in result.lower()
@@ -157,24 +151,21 @@ class TestTextCleaner:
         assert "like" not in result.lower()
         assert "click the button" in result.lower()
     
-    def test_clean_text_so_is_not_filler(self):
+    def test_clean_text_so_is_not_filler(self, cleaner):
         """'so' is a classification keyword, not a filler word"""
-        cleaner = TextCleaner()
         text = "so click the button"
         result = cleaner.clean_text(text)
         # 'so' should remain as it's used for classification
         assert "so" in result.lower()
         assert "click the button" in result.lower()
     
-    def test_parse_timestamp(self):
-        cleaner = TextCleaner()
+    def test_parse_timestamp(self, cleaner):
         assert cleaner._parse_timestamp("0:00:30") == 30.0
         assert cleaner._parse_timestamp("0:01:30") == 90.0
         assert cleaner._parse_timestamp("1:00:00") == 3600.0
         assert cleaner._parse_timestamp("1:30") == 90.0
     
-    def test_clean_segments(self, sample_segments):
-        cleaner = TextCleaner()
+    def test_clean_segments(self, cleaner, sample_segments):
         cleaned = cleaner.clean_segments(sample_segments)
         
         # All segments should remain (music becomes "." which is >= 3 chars when cleaned)
@@ -190,9 +181,8 @@ class TestTextCleaner:
         assert "end_seconds" in cleaned[0]
         assert cleaned[0]["start_seconds"] == 0.0
     
-    def test_clean_segments_filters_music(self):
+    def test_clean_segments_filters_music(self, cleaner):
         """Test that [music] tags are properly removed"""
-        cleaner = TextCleaner()
         segments = [
             {"start": "0:00:00", "end": "0:00:03", "text": "[music]", "confidence": -0.5},
             {"start": "0:00:03", "end": "0:00:06", "text": "Click the button", "confidence": -0.3}
@@ -208,72 +198,89 @@ class TestTextCleaner:
         texts = [s["text"] for s in cleaned]
         assert not any("music" in t.lower() for t in texts)
     
-    def test_clean_segments_empty_list(self):
-        cleaner = TextCleaner()
+    def test_clean_segments_empty_list(self, cleaner):
         result = cleaner.clean_segments([])
         assert result == []
     
-    def test_clean_segments_preserves_original(self, sample_segments):
-        cleaner = TextCleaner()
+    def test_clean_segments_preserves_original(self, cleaner, sample_segments):
         cleaned = cleaner.clean_segments(sample_segments)
         if cleaned:  # If any segments remain
             assert "original_text" in cleaned[0]
 
 
+# ============================================================================
+# KeywordTrie Tests
+# ============================================================================
+
+class TestKeywordTrie:
+
+    def test_scan_finds_multiword_keyword(self):
+        from nlp import keyword_trie
+
+        trie = keyword_trie.build_trie({"transition": ["after that"]})
+        matches = keyword_trie.scan(trie, "and after that we save")
+        assert [(m[2]) for m in matches] == ["transition"]
+
+    def test_scan_respects_word_boundaries(self):
+        from nlp import keyword_trie
+
+        trie = keyword_trie.build_trie({"greeting": ["hi"]})
+        assert keyword_trie.scan(trie, "this is fine") == []
+        assert keyword_trie.scan(trie, "hi there")[0][2] == "greeting"
+
+    def test_shared_keyword_reports_all_labels(self):
+        from nlp import keyword_trie
+
+        trie = keyword_trie.build_trie({"explanation": ["this is"], "definition": ["this is"]})
+        labels = {m[2] for m in keyword_trie.scan(trie, "this is a test")}
+        assert labels == {"explanation", "definition"}
+
+
 # ============================================================================
 # SegmentClassifier Tests
 # ============================================================================
 
 class TestSegmentClassifier:
     
-    def test_classify_action(self):
-        classifier = SegmentClassifier()
+    def test_classify_action(self, classifier):
         assert classifier.classify("Click on the file") == "action"
         assert classifier.classify("Open the menu") == "action"
         assert classifier.classify("Select the option") == "action"
     
-    def test_classify_explanation(self):
-        classifier = SegmentClassifier()
+    def test_classify_explanation(self, classifier):
         assert classifier.classify("So this is how it works") == "explanation"
         assert classifier.classify("Basically what happens is") == "explanation"
         assert classifier.classify("This is important") == "explanation"
     
-    def test_classify_question(self):
-        classifier = SegmentClassifier()
+    def test_classify_question(self, classifier):
         assert classifier.classify("How do I do this?") == "question"
         assert classifier.classify("What is this?") == "question"
     
-    def test_classify_transition(self):
-        classifier = SegmentClassifier()
+    def test_classify_transition(self, classifier):
         assert classifier.classify("Next, we will") == "transition"
         assert classifier.classify("Now let's move on") == "transition"
     
-    def test_classify_noise(self):
-        classifier = SegmentClassifier()
+    def test_classify_noise(self, classifier):
         assert classifier.classify("") == "noise"
         assert classifier.classify("um") == "noise"
         assert classifier.classify("uh", confidence=-2.0) == "noise"
     
-    def test_classify_statement_pure(self):
+    def test_classify_statement_pure(self, classifier):
         """Test classification of pure statements without trigger words"""
-        classifier = SegmentClassifier()
         # Use a statement that doesn't contain any classification keywords
         result = classifier.classify("The application displays information.")
         assert result == "statement"
     
-    def test_classify_this_is_triggers_explanation(self):
+    def test_classify_this_is_triggers_explanation(self, classifier):
         """'This is' triggers explanation classification"""
-        classifier = SegmentClassifier()
         result = classifier.classify("This is a regular statement.")
         assert result == "explanation"
 
-    def test_classify_greeting_and_farewell(self):
-        classifier = SegmentClassifier()
+    def test_classify_greeting_and_farewell(self, classifier):
         assert classifier.classify("Hello everyone") == "greeting"
         assert classifier.classify("Thanks and goodbye") == "farewell"
     
-    def test_classify_segments(self):
-        classifier = SegmentClassifier()
+    def test_classify_segments(self, classifier):
         segments = [
             {"text": "Click the button", "confidence": -0.3},
             {"text": "So this is important", "confidence": -0.2},
@@ -298,8 +305,7 @@ class TestSegmentClassifier:
         assert all("label" in s for s in classified)
         assert all(s["label_source"] == "llm" for s in classified)
     
-    def test_classify_segments_empty(self):
-        classifier = SegmentClassifier()
+    def test_classify_segments_empty(self, classifier):
         result = classifier.classify_segments([])
         assert result == []
 
@@ -310,14 +316,12 @@ class TestSegmentClassifier:
 
 class TestSummarizer:
     
-    def test_rule_based_summary_short_text(self):
-        summarizer = Summarizer()
+    def test_rule_based_summary_short_text(self, summarizer):
         text = "This is a short text."
         result = summarizer._rule_based_summary(text)
         assert result == text
     
-    def test_rule_based_summary_long_text(self):
-        summarizer = Summarizer()
+    def test_rule_based_summary_long_text(self, summarizer):
         text = "First sentence. Second sentence. Third sentence. Fourth sentence. Fifth sentence."
         result = summarizer._rule_based_summary(text, max_sentences=2)
         
@@ -331,8 +335,7 @@ class TestSummarizer:
         sentence_count = result.count("sentence")
         assert sentence_count == 2, f"Expected 2 sentences, got {sentence_count}"
     
-    def test_summarize_text_no_model(self):
-        summarizer = Summarizer()
+    def test_summarize_text_no_model(self, summarizer):
         passages = ["First part.", "Second part.", "Third part."]
         result = summarizer.summarize_text(passages, use_llm=False)
         assert isinstance(result, str)
@@ -344,8 +347,7 @@ class TestSummarizer:
         result = summarizer.summarize_text(passages, use_llm=True)
         assert "test summary" in result.lower()
     
-    def test_summarize_segments(self):
-        summarizer = Summarizer()
+    def test_summarize_segments(self, summarizer):
         segments = [
             {"text": "Click the button.", "label": "action"},
             {"text": "This is how it works.", "label": "explanation"},
@@ -357,8 +359,7 @@ class TestSummarizer:
         assert "This is how it works" in result
         assert "um" not in result
     
-    def test_summarize_empty(self):
-        summarizer = Summarizer()
+    def test_summarize_empty(self, summarizer):
         result = summarizer.summarize_segments([])
         assert "No content" in result
 
@@ -369,8 +370,7 @@ class TestSummarizer:
 
 class TestStepExtractor:
     
-    def test_extract_steps_from_actions(self):
-        extractor = StepExtractor()
+    def test_extract_steps_from_actions(self, extractor):
         segments = [
             {"text": "Click OK.", "label": "action"},
             {"text": "Open the file.", "label": "action"},
@@ -391,8 +391,7 @@ class TestStepExtractor:
         steps = extractor.extract_steps(segments, use_llm=True)
         assert len(steps) > 0
     
-    def test_merge_similar_steps(self):
-        extractor = StepExtractor()
+    def test_merge_similar_steps(self, extractor):
         steps = [
             "Click the button.",
             "Click the button.",
@@ -401,13 +400,11 @@ class TestStepExtractor:
         merged = extractor._merge_similar_steps(steps)
         assert len(merged) < len(steps)
     
-    def test_extract_steps_empty(self):
-        extractor = StepExtractor()
+    def test_extract_steps_empty(self, extractor):
         result = extractor.extract_steps([])
         assert result == []
     
-    def test_parse_llm_steps(self):
-        extractor = StepExtractor()
+    def test_parse_llm_steps(self, extractor):
         response = "1. First step\n2. Second step\n3. Third step"
         steps = extractor._parse_llm_steps(response)
         assert len(steps) == 3
@@ -420,8 +417,7 @@ class TestStepExtractor:
 
 class TestDocumentStructurer:
     
-    def test_build_document(self, sample_transcript):
-        structurer = DocumentStructurer()
+    def test_build_document(self, structurer, sample_transcript):
         
         cleaned = [{"text": "Test", "start_seconds": 0, "end_seconds": 3}]
         classified = [
@@ -462,21 +458,18 @@ class TestDocumentStructurer:
         assert len(doc["steps"]) == 1
         assert len(doc["timeline"]) == 1
     
-    def test_generate_title_from_content(self):
-        structurer = DocumentStructurer()
+    def test_generate_title_from_content(self, structurer):
         segments = [
             {"text": "This is a comprehensive guide to using the application.", "label": "explanation"}
         ]
         title = structurer._generate_title(segments, "fallback")
         assert "comprehensive guide" in title.lower()
     
-    def test_generate_title_fallback(self):
-        structurer = DocumentStructurer()
+    def test_generate_title_fallback(self, structurer):
         title = structurer._generate_title([], "test_id")
         assert "test_id" in title
     
-    def test_extract_key_concepts(self):
-        structurer = DocumentStructurer()
+    def test_extract_key_concepts(self, structurer):
         segments = [
             {"text": "A variable is a container.", "label": "definition"},
             {"text": "Click here.", "label": "action"}
@@ -485,8 +478,7 @@ class TestDocumentStructurer:
         assert len(concepts) == 1
         assert "variable" in concepts[0].lower()
     
-    def test_calculate_stats(self, sample_transcript):
-        structurer = DocumentStructurer()
+    def test_calculate_stats(self, structurer, sample_transcript):
         segments = [
             {"text": "Click the button.", "label": "action"},
             {"text": "This is important.", "label": "explanation"}
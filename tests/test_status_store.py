@@ -0,0 +1,50 @@
+import pytest
+
+from src.web import status_store
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes = {}
+        self.ttls = {}
+
+    def hset(self, key, mapping=None):
+        self.hashes.setdefault(key, {}).update(mapping or {})
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def expire(self, key, ttl):
+        self.ttls[key] = ttl
+
+
+def test_redis_store_roundtrip_coerces_progress():
+    store = status_store.RedisStatusStore(FakeRedis())
+
+    store.set("job-1", {"status": "processing", "progress": 40, "message": "Trimming"})
+    data = store.get("job-1")
+
+    assert data["status"] == "processing"
+    assert data["progress"] == 40
+    assert isinstance(data["progress"], int)
+
+
+def test_redis_store_missing_job_returns_none():
+    store = status_store.RedisStatusStore(FakeRedis())
+
+    assert store.get("nope") is None
+
+
+def test_redis_store_sets_expiry():
+    client = FakeRedis()
+    store = status_store.RedisStatusStore(client, ttl_seconds=60)
+
+    store.set("job-2", {"status": "queued", "progress": 0})
+
+    assert client.ttls["job:job-2"] == 60
+
+
+def test_create_status_store_without_url_returns_none(monkeypatch):
+    monkeypatch.delenv("REDIS_URL", raising=False)
+
+    assert status_store.create_status_store() is None
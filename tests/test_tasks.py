@@ -0,0 +1,36 @@
+import pytest
+
+from src.web import tasks
+
+
+def test_enqueue_without_queue_returns_false(monkeypatch):
+    monkeypatch.setattr(tasks, "celery_app", None)
+
+    assert tasks.queue_available() is False
+    assert tasks.enqueue("job-1", "/tmp/video.mp4") is False
+
+
+def test_enqueue_uses_configured_queue(monkeypatch):
+    calls = []
+
+    class FakeTask:
+        def delay(self, *args):
+            calls.append(args)
+
+    monkeypatch.setattr(tasks, "celery_app", object())
+    monkeypatch.setattr(tasks, "run_pipeline_task", FakeTask(), raising=False)
+
+    assert tasks.queue_available() is True
+    assert tasks.enqueue("job-2", "/tmp/video.mp4") is True
+    assert calls == [("job-2", "/tmp/video.mp4")]
+
+
+def test_enqueue_falls_back_on_broker_error(monkeypatch):
+    class BrokenTask:
+        def delay(self, *args):
+            raise ConnectionError("broker unreachable")
+
+    monkeypatch.setattr(tasks, "celery_app", object())
+    monkeypatch.setattr(tasks, "run_pipeline_task", BrokenTask(), raising=False)
+
+    assert tasks.enqueue("job-3", "/tmp/video.mp4") is False
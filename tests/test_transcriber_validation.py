@@ -29,3 +29,98 @@ def test_transcribe_segment_raises_on_none(monkeypatch):
 
     with pytest.raises(FileNotFoundError):
         tr.transcribe_segment(None)
+
+
+def test_injected_model_skips_loading(monkeypatch, tmp_path):
+    import src.transcription.whisper_transcriber as wt
+
+    def boom(name):
+        raise AssertionError("load_model should not be called when a model is injected")
+
+    monkeypatch.setattr("whisper.load_model", boom)
+
+    class DummyModel:
+        def transcribe(self, path, **opts):
+            return {"segments": [], "text": "", "duration": 0}
+
+    tr = wt.WhisperTranscriber(model_name="tiny", output_dir=str(tmp_path), model=DummyModel())
+    assert isinstance(tr.model, DummyModel)
+
+
+def test_maybe_compile_leaves_stub_models_untouched():
+    import src.transcription.whisper_transcriber as wt
+
+    class DummyModel:
+        def transcribe(self, path, **opts):
+            return {"segments": [], "text": "", "duration": 0}
+
+    model = DummyModel()
+    assert wt._maybe_compile(model) is model
+
+
+def test_maybe_compile_wraps_encoder_decoder():
+    import src.transcription.whisper_transcriber as wt
+
+    if wt.torch is None or not hasattr(wt.torch, "compile"):
+        pytest.skip("torch.compile unavailable")
+
+    class Stage(wt.torch.nn.Module):
+        def forward(self, x):
+            return x
+
+    class FakeWhisper:
+        encoder = Stage()
+        decoder = Stage()
+
+    model = wt._maybe_compile(FakeWhisper())
+    assert model.encoder is not FakeWhisper.encoder
+    assert model.decoder is not FakeWhisper.decoder
+    assert callable(model.encoder)
+
+
+def test_transcribe_segment_accepts_preloaded_audio(tmp_path):
+    import numpy as np
+
+    import src.transcription.whisper_transcriber as wt
+
+    class DummyModel:
+        def transcribe(self, audio, **opts):
+            assert isinstance(audio, np.ndarray)
+            return {
+                "segments": [{"start": 0.0, "end": 1.0, "text": "hi"}],
+                "text": "hi",
+                "duration": 1.0,
+            }
+
+    tr = wt.WhisperTranscriber(model_name="tiny", output_dir=str(tmp_path), model=DummyModel())
+    res = tr.transcribe_segment(audio=np.zeros(16000, dtype=np.float32), segment_id="seg0")
+
+    assert res["segment_id"] == "seg0"
+    assert res["raw_text"] == "hi"
+    assert (tmp_path / "seg0.json").exists()
+
+
+def test_default_compute_type_matches_hardware():
+    import src.transcription.whisper_transcriber as wt
+
+    has_cuda = wt.torch is not None and wt.torch.cuda.is_available()
+    expected = "int8_float16" if has_cuda else "int8"
+    assert wt._default_compute_type() == expected
+
+
+@pytest.mark.requires_gpu
+def test_cudnn_benchmark_enabled_on_gpu():
+    import src.transcription.whisper_transcriber as wt
+
+    assert wt.torch.backends.cudnn.benchmark is True
+
+
+def test_transcribe_segments_batched_empty(monkeypatch, tmp_path):
+    import src.transcription.whisper_transcriber as wt
+
+    class DummyModel:
+        def transcribe(self, path, **opts):
+            return {"segments": [], "text": "", "duration": 0}
+
+    tr = wt.WhisperTranscriber(model_name="tiny", output_dir=str(tmp_path), model=DummyModel())
+    assert tr.transcribe_segments_batched([]) == []
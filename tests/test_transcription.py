@@ -32,3 +32,34 @@ def test_timestamp_align_and_combine():
     combined = combine_segment_transcripts([aligned])
     assert len(combined["combined_segments"]) == 1
     assert combined["combined_segments"][0]["start_global"] == 5.0
+
+def test_transcribe_segment_batched_backend(monkeypatch, tmp_path):
+    from types import SimpleNamespace
+    import src.transcription.whisper_transcriber as wt
+
+    # Avoid loading a real model for the fallback path
+    monkeypatch.setattr("whisper.load_model", lambda name: object())
+
+    tr = wt.WhisperTranscriber(model_name="tiny", output_dir=str(tmp_path))
+
+    class FakeBatched:
+        def transcribe(self, path, **opts):
+            segs = [
+                SimpleNamespace(start=0.0, end=1.0, text=" hello", avg_logprob=-0.1, words=None),
+                SimpleNamespace(start=1.0, end=2.0, text=" world", avg_logprob=-0.2, words=None),
+            ]
+            info = SimpleNamespace(duration=2.0, language="en")
+            return iter(segs), info
+
+    tr._batched = FakeBatched()
+    monkeypatch.setattr(tr, "_extract_audio", lambda video, audio: audio)
+
+    vid = tmp_path / "v.mp4"
+    vid.write_bytes(b"dummy")
+
+    res = tr.transcribe_segment(str(vid), segment_id="batched")
+    assert res["raw_text"] == "hello world"
+    assert res["duration"] == 2.0
+    assert len(res["segments"]) == 2
+    # Timestamps keep the HH:MM:SS shape used by downstream processing
+    assert res["segments"][0]["start"] == "0:00:00"
@@ -6,44 +6,19 @@ from src.trimmer.video_trimmer import VideoTrimmer
 from src.trimmer.batch_video_trimmer import BatchVideoTrimmer
 
 
-# Test fixture paths
+# Test fixture paths. The scratch dirs get a per-worker suffix so that
+# pytest-xdist workers (pytest -n auto --dist loadfile) never race on the
+# rmtree/mkdir cycles in the fixtures below; under plain pytest the env
+# var is unset and the names are unchanged.
+_WORKER_SUFFIX = os.environ.get("PYTEST_XDIST_WORKER", "")
 TEST_DIR = "tests"
-TEST_SEGMENTS_DIR = "test_segments"
-TEST_INPUT_DIR = "test_input_videos"
+TEST_SEGMENTS_DIR = "test_segments" + (f"_{_WORKER_SUFFIX}" if _WORKER_SUFFIX else "")
+TEST_INPUT_DIR = "test_input_videos" + (f"_{_WORKER_SUFFIX}" if _WORKER_SUFFIX else "")
 SAMPLE_VIDEO = os.path.join(TEST_DIR, "sample_video.mp4")
 
 
-@pytest.fixture(scope="module")
-def test_video():
-    """
-    Create a test video using FFmpeg if it doesn't exist.
-    Creates a 10-second video with color changes (for scene detection).
-    """
-    os.makedirs(TEST_DIR, exist_ok=True)
-    
-    if not os.path.exists(SAMPLE_VIDEO):
-        # Generate test video: exactly 10 seconds with color pattern changes
-        import ffmpeg
-        try:
-            # Create a simple 10-second test pattern video
-            (
-                ffmpeg
-                .input("testsrc=duration=10:size=640x480:rate=30", f="lavfi")
-                .filter("fps", fps=30)
-                .output(
-                    SAMPLE_VIDEO, 
-                    pix_fmt="yuv420p", 
-                    vcodec="libx264",
-                    t=10,  # Explicitly set duration to 10 seconds
-                    preset="ultrafast"
-                )
-                .overwrite_output()
-                .run(quiet=True, capture_stderr=True)
-            )
-        except ffmpeg.Error as e:
-            pytest.skip(f"Could not generate test video: {e.stderr.decode()}")
-    
-    yield SAMPLE_VIDEO
+# The 10-second test video is provided by the session-scoped `test_video`
+# fixture in conftest.py, shared with the rest of the suite.
 
 
 @pytest.fixture
@@ -72,9 +47,15 @@ def batch_trimmer(test_video):
     if os.path.exists(TEST_SEGMENTS_DIR):
         shutil.rmtree(TEST_SEGMENTS_DIR)
     
-    # Copy test video to input dir
-    shutil.copy(test_video, os.path.join(TEST_INPUT_DIR, "test1.mp4"))
-    shutil.copy(test_video, os.path.join(TEST_INPUT_DIR, "test2.mp4"))
+    # Hardlink the test video into the input dir: BatchVideoTrimmer only
+    # reads its inputs, so an inode reference beats re-copying the bytes.
+    # Fall back to a real copy if the dirs sit on different filesystems.
+    for name in ("test1.mp4", "test2.mp4"):
+        dst = os.path.join(TEST_INPUT_DIR, name)
+        try:
+            os.link(test_video, dst)
+        except OSError:
+            shutil.copy(test_video, dst)
     
     batch = BatchVideoTrimmer(TEST_INPUT_DIR, TEST_SEGMENTS_DIR)
     yield batch
@@ -116,6 +97,14 @@ class TestVideoTrimmer:
             2.5 <= duration <= 3.5 or 4.5 <= duration <= 5.5
         ), f"Duration {duration} outside expected ranges"
 
+    def test_trim_frame_accurate(self, trimmer, test_video):
+        """Frame-accurate trimming re-encodes to hit the exact cut."""
+        output = trimmer.trim(test_video, 2, 5, frame_accurate=True)
+        assert os.path.exists(output)
+
+        duration = trimmer.get_duration(output)
+        assert 2.5 <= duration <= 3.5, f"Duration {duration} outside expected range"
+
     def test_trim_invalid_file(self, trimmer):
         """Test trimming with non-existent file."""
         with pytest.raises(FileNotFoundError):
@@ -194,6 +183,14 @@ class TestVideoTrimmer:
         
         assert len(segments) <= max_segs
     
+    def test_apply_constraints_is_pure(self, trimmer):
+        """Constraint filtering works on cached timestamps without ffmpeg."""
+        segments = trimmer._apply_constraints(
+            [2.0, 2.4, 5.0], duration=10.0, min_length=1.0, max_segments=2
+        )
+        # The 2.0-2.4 span is dropped as too short; max_segments truncates
+        assert segments == [(0.0, 2.0), (2.4, 5.0)]
+
     def test_get_segment_info(self, trimmer, test_video):
         """Test segment info retrieval."""
         # Create some segments first
@@ -264,4 +261,25 @@ class TestBatchVideoTrimmer:
         assert "%" in summary["success_rate"]
 
 
-# Run tests with: pytest test_trimmer.py -v
\ No newline at end of file
+# Run tests with: pytest test_trimmer.py -v
+
+class TestAdaptiveSceneDetection:
+    def test_detect_scene_changes_adaptive(self, test_video, trimmer):
+        timestamps, chosen = trimmer.detect_scene_changes_adaptive(test_video)
+
+        assert isinstance(timestamps, list)
+        assert all(isinstance(ts, float) for ts in timestamps)
+        assert timestamps == sorted(timestamps)
+        assert 0.1 <= chosen <= 0.6
+
+    def test_detect_scene_changes_adaptive_nonexistent(self, trimmer):
+        with pytest.raises(FileNotFoundError):
+            trimmer.detect_scene_changes_adaptive("nonexistent.mp4")
+
+    def test_auto_segment_auto_threshold(self, test_video, trimmer):
+        segments = trimmer.auto_segment(test_video, threshold="auto", min_length=1.0)
+
+        # Even with zero detected cuts the full video yields one segment
+        assert len(segments) >= 1
+        for seg in segments:
+            assert os.path.exists(seg)
@@ -14,24 +14,8 @@ def test_is_allowed_format_negative():
     assert not validation.is_allowed_format("document.txt")
 
 
-def test_validate_video_success(tmp_path, monkeypatch):
-    # Create a tiny test video with ffmpeg similar to other tests
-    test_video = tmp_path / "tiny.mp4"
-
-    import ffmpeg
-    # Create a 2-second color test video
-    try:
-        (
-            ffmpeg
-            .input("testsrc=duration=2:size=320x240:rate=15", f="lavfi")
-            .output(str(test_video), vcodec="libx264", pix_fmt="yuv420p", t=2, preset="ultrafast")
-            .overwrite_output()
-            .run(quiet=True, capture_stderr=True)
-        )
-    except ffmpeg.Error as e:
-        pytest.skip("ffmpeg not available for creating test video")
-
-    valid, problems = validation.validate_video(str(test_video))
+def test_validate_video_success(tiny_video):
+    valid, problems = validation.validate_video(tiny_video)
     assert valid
     assert problems == []
 
@@ -40,9 +24,27 @@ def test_validate_video_duration_too_long(tmp_path, monkeypatch):
     test_video = tmp_path / "dummy.mp4"
     test_video.write_text("dummy")
 
-    # Monkeypatch get_video_duration to return > 900
-    monkeypatch.setattr(validation, "get_video_duration", lambda p: 901.0)
+    # Monkeypatch the probe to return a valid container but > 900s duration
+    monkeypatch.setattr(
+        validation, "probe_video_info", lambda p: (901.0, frozenset({"mp4"}))
+    )
 
     valid, problems = validation.validate_video(str(test_video))
     assert not valid
     assert "duration_too_long" in problems
+
+
+def test_probe_video_info_reports_container(tiny_video):
+    duration, format_names = validation.probe_video_info(tiny_video)
+    assert duration > 0
+    assert "mp4" in format_names
+
+
+def test_validate_video_rejects_mislabelled_container(tmp_path):
+    # A text file with an allowed extension must not pass the probe check
+    fake_video = tmp_path / "fake.mp4"
+    fake_video.write_text("not a video at all")
+
+    valid, problems = validation.validate_video(str(fake_video))
+    assert not valid
+    assert "duration_unreadable" in problems
@@ -7,42 +7,50 @@ from fastapi.testclient import TestClient
 from src.web import app as web_app
 
 
-@pytest.fixture(autouse=True)
-def disable_pipeline(monkeypatch):
-    # Avoid running the heavy background pipeline during tests; replace with no-op
-    monkeypatch.setattr("src.web.app.run_pipeline", lambda *a, **k: None)
+@pytest.fixture(scope="module", autouse=True)
+def disable_pipeline():
+    # Avoid running the heavy background pipeline during tests; replace
+    # with a no-op once for the whole module.
+    mp = pytest.MonkeyPatch()
+    mp.setattr("src.web.app.run_pipeline", lambda *a, **k: None)
     yield
+    mp.undo()
 
 
-def test_api_health():
-    client = TestClient(web_app.app)
+@pytest.fixture(scope="module")
+def client():
+    # One shared ASGI client: handlers resolve JOB_DIR/OUTPUT_DIR and
+    # friends per request, so tests can still repoint the module globals.
+    with TestClient(web_app.app) as c:
+        yield c
+
+
+def test_api_health(client):
     r = client.get("/api/health")
     assert r.status_code == 200
     assert r.json() == {"status": "ok"}
 
 
-def test_upload_creates_job_file(tmp_path):
-    # configure a temporary JOB_DIR to avoid touching system /tmp
+# The upload tests repoint JOB_DIR and UPLOAD_DIR at tmp_path rather
+# than using a fake in-memory filesystem: the handler writes the upload
+# and job file from a threadpool worker while the client drives the ASGI
+# app, and the payloads are a few bytes — patching open() process-wide
+# for the module-scoped TestClient buys nothing and risks leaking the
+# fake FS into the ffmpeg/status code under test.
+def test_upload_creates_job_file(client, tmp_path, monkeypatch):
+    # configure temporary dirs so no files land in the working tree
     job_dir = tmp_path / "jobs"
     job_dir.mkdir()
 
-    # Monkeypatch the job directory used by the app
-    from importlib import reload
     import src.web.app as appmod
 
     appmod.JOB_DIR = job_dir
+    appmod.UPLOAD_DIR = tmp_path
 
     # Monkeypatch validate_video to avoid ffmpeg.probe on dummy bytes
     import src.utils.validation as valmod
-    from importlib import reload as _reload
-    _reload(valmod)
-    import types
-    def _fake_validate(path):
-        return True, []
-    monkeypatch = pytest.MonkeyPatch()
-    monkeypatch.setattr(valmod, "validate_video", _fake_validate)
 
-    client = TestClient(appmod.app)
+    monkeypatch.setattr(valmod, "validate_video", lambda path: (True, []))
 
     file_bytes = b"dummy video data"
     files = {"video": ("example.mp4", file_bytes, "video/mp4")}
@@ -58,29 +66,24 @@ def test_upload_creates_job_file(tmp_path):
     data = json.loads(job_file.read_text())
     assert data.get("status") in ("queued", "running")
 
-    monkeypatch.undo()
-
 
-def test_upload_rejected_on_validation(tmp_path):
+def test_upload_rejected_on_validation(client, tmp_path, monkeypatch):
     # Ensure invalid uploads are rejected with a 400 and error details
     job_dir = tmp_path / "jobs"
     job_dir.mkdir()
 
-    from importlib import reload
     import src.web.app as appmod
 
     appmod.JOB_DIR = job_dir
+    appmod.UPLOAD_DIR = tmp_path
 
     # Monkeypatch validate_video to return invalid
     import src.utils.validation as valmod
-    def _bad_validate(path):
-        return False, ["duration_too_long"]
 
-    from fastapi.testclient import TestClient
-    monkeypatch = pytest.MonkeyPatch()
-    monkeypatch.setattr(valmod, "validate_video", _bad_validate)
+    monkeypatch.setattr(
+        valmod, "validate_video", lambda path: (False, ["duration_too_long"])
+    )
 
-    client = TestClient(appmod.app)
     file_bytes = b"dummy video data"
     files = {"video": ("example.mp4", file_bytes, "video/mp4")}
 
@@ -88,4 +91,214 @@ def test_upload_rejected_on_validation(tmp_path):
     assert r.status_code == 400
     assert r.json() == {"detail": {"errors": ["duration_too_long"]}}
 
-    monkeypatch.undo()
+
+def test_download_serves_nested_paths_with_media_type(client, tmp_path):
+    import src.web.app as appmod
+
+    appmod.OUTPUT_DIR = tmp_path
+    gifs = tmp_path / "job-dl" / "gifs"
+    gifs.mkdir(parents=True)
+    (gifs / "gif_000.gif").write_bytes(b"GIF89a")
+
+    r = client.get("/download/job-dl/gifs/gif_000.gif")
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "image/gif"
+    assert r.content == b"GIF89a"
+
+
+def test_download_rejects_path_traversal(client, tmp_path):
+    import src.web.app as appmod
+
+    appmod.OUTPUT_DIR = tmp_path
+    (tmp_path / "job-dl").mkdir()
+    secret = tmp_path / "secret.txt"
+    secret.write_text("top secret")
+
+    # Encoded dot-segments survive client-side URL normalization
+    r = client.get("/download/job-dl/%2E%2E/secret.txt")
+    assert r.status_code == 404
+
+
+def test_download_serves_precompressed_variant(client, tmp_path):
+    import gzip
+
+    import src.web.app as appmod
+
+    appmod.OUTPUT_DIR = tmp_path
+    job_dir = tmp_path / "job-gz"
+    job_dir.mkdir()
+    (job_dir / "documentation.html").write_text("<html>doc</html>")
+    with gzip.open(job_dir / "documentation.html.gz", "wb") as fh:
+        fh.write(b"<html>doc</html>")
+
+    r = client.get("/download/job-gz/documentation.html", headers={"Accept-Encoding": "gzip"})
+    assert r.status_code == 200
+    assert r.headers.get("content-encoding") == "gzip"
+    # httpx transparently decompresses
+    assert r.content == b"<html>doc</html>"
+
+    # Clients that don't accept gzip get the plain file
+    r = client.get("/download/job-gz/documentation.html", headers={"Accept-Encoding": "identity"})
+    assert r.status_code == 200
+    assert r.headers.get("content-encoding") is None
+    assert r.content == b"<html>doc</html>"
+
+
+def test_write_gzip_variants(tmp_path):
+    import gzip
+
+    import src.web.app as appmod
+
+    (tmp_path / "documentation.json").write_text('{"title": "doc"}')
+    appmod._write_gzip_variants(tmp_path)
+
+    gz = tmp_path / "documentation.json.gz"
+    assert gz.exists()
+    with gzip.open(gz, "rb") as fh:
+        assert fh.read() == b'{"title": "doc"}'
+
+
+def test_upload_rejects_oversize_content_length(client, tmp_path, monkeypatch):
+    import src.web.app as appmod
+
+    appmod.JOB_DIR = tmp_path
+
+    monkeypatch.setattr(appmod.config, "MAX_UPLOAD_SIZE_BYTES", 8)
+
+    files = {"video": ("example.mp4", b"way more than eight bytes", "video/mp4")}
+    r = client.post("/upload/", files=files)
+    assert r.status_code == 413
+
+
+def test_copy_limited_enforces_cap(tmp_path):
+    import io
+
+    import src.web.app as appmod
+
+    dst = tmp_path / "out.bin"
+    with dst.open("wb") as fh:
+        appmod._copy_limited(io.BytesIO(b"x" * 10), fh, limit=10, chunk_size=4)
+    assert dst.stat().st_size == 10
+
+    with pytest.raises(appmod._UploadTooLargeError):
+        with dst.open("wb") as fh:
+            appmod._copy_limited(io.BytesIO(b"x" * 11), fh, limit=10, chunk_size=4)
+
+
+def test_status_served_from_memory_before_flush(client, tmp_path):
+    import src.web.app as appmod
+
+    appmod.JOB_DIR = tmp_path
+
+    appmod._write_status("job-mem", status="running", phase="Transcribing", progress=30)
+    try:
+        r = client.get("/status/job-mem")
+        assert r.status_code == 200
+        assert r.json()["phase"] == "Transcribing"
+    finally:
+        appmod._flush_status("job-mem")
+        with appmod._STATUS_LOCK:
+            appmod._JOB_STATUS.pop("job-mem", None)
+
+
+def test_result_page_references_download_iframe(client, tmp_path):
+    import src.web.app as appmod
+
+    appmod.OUTPUT_DIR = tmp_path
+    job_dir = tmp_path / "job-res"
+    job_dir.mkdir()
+    (job_dir / "documentation.html").write_text("<html><body>big generated doc</body></html>")
+
+    r = client.get("/result/job-res")
+    assert r.status_code == 200
+    # The document itself is not inlined; the shell embeds it via /download
+    assert "/download/job-res/documentation.html" in r.text
+    assert "big generated doc" not in r.text
+
+
+def test_events_stream_ends_after_terminal_status(client, tmp_path):
+    import src.web.app as appmod
+
+    appmod.JOB_DIR = tmp_path
+    (tmp_path / "job-sse.json").write_text(
+        json.dumps({"status": "completed", "phase": "Complete", "progress": 100})
+    )
+
+    with client.stream("GET", "/events/job-sse") as r:
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("text/event-stream")
+        body = b"".join(r.iter_raw()).decode()
+
+    assert body.startswith("data: ")
+    assert json.loads(body[len("data: "):].strip())["status"] == "completed"
+
+
+def test_write_status_notifies_subscribers(tmp_path):
+    import queue
+
+    import src.web.app as appmod
+
+    appmod.JOB_DIR = tmp_path
+    q = queue.Queue()
+    with appmod._STATUS_LOCK:
+        appmod._SUBSCRIBERS.setdefault("job-sub", []).append(q)
+
+    try:
+        appmod._write_status("job-sub", status="running", phase="Transcribing", progress=30)
+        event = q.get_nowait()
+        assert event["phase"] == "Transcribing"
+    finally:
+        with appmod._STATUS_LOCK:
+            appmod._SUBSCRIBERS.pop("job-sub", None)
+        appmod._flush_status("job-sub")
+        with appmod._STATUS_LOCK:
+            appmod._JOB_STATUS.pop("job-sub", None)
+
+
+def test_status_etag_roundtrip_returns_304(client, tmp_path):
+    import src.web.app as appmod
+
+    appmod.JOB_DIR = tmp_path
+    (tmp_path / "job-etag.json").write_text(
+        json.dumps({"status": "running", "phase": "Transcribing", "progress": 30})
+    )
+
+    r = client.get("/status/job-etag")
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+    assert etag
+
+    r2 = client.get("/status/job-etag", headers={"If-None-Match": etag})
+    assert r2.status_code == 304
+    assert r2.content == b""
+
+
+def test_download_etag_roundtrip_returns_304(client, tmp_path):
+    import src.web.app as appmod
+
+    appmod.OUTPUT_DIR = tmp_path
+    job_dir = tmp_path / "job-dl-etag"
+    job_dir.mkdir()
+    (job_dir / "documentation.json").write_text('{"title": "doc"}')
+
+    r = client.get("/download/job-dl-etag/documentation.json")
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+
+    r2 = client.get("/download/job-dl-etag/documentation.json", headers={"If-None-Match": etag})
+    assert r2.status_code == 304
+
+
+def test_terminal_status_flushed_immediately(tmp_path):
+    import src.web.app as appmod
+
+    appmod.JOB_DIR = tmp_path
+
+    appmod._write_status("job-done", status="completed", phase="Complete", progress=100)
+
+    status_file = tmp_path / "job-done.json"
+    assert status_file.exists()
+    assert json.loads(status_file.read_text())["status"] == "completed"
+    # Terminal entries are not pinned in memory
+    with appmod._STATUS_LOCK:
+        assert "job-done" not in appmod._JOB_STATUS